@@ -1,27 +1,114 @@
 """
 FastAPI application for semantic product search using Weaviate.
 """
-from fastapi import FastAPI, Request, Form
-from fastapi.responses import HTMLResponse, RedirectResponse
+import asyncio
+import hashlib
+import hmac
+import logging
+import os
+import uuid
+from contextlib import asynccontextmanager, suppress
+from urllib.parse import urlencode
+from fastapi import FastAPI, Request, Form, Query, HTTPException
+from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse, Response
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
-from weaviate_client import WeaviateClient
-from typing import Optional
+from fastapi.middleware.gzip import GZipMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST, Gauge, generate_latest
+from metrics import SEARCH_RESULTS, ServerTimingMiddleware, timed
+from query_cache import QueryCache
+from suggest import MAX_SUGGESTIONS, SUGGEST_FIELDS, default_suggest_index
+from weaviate_client import AsyncWeaviateClient
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, ConfigDict, Field
 
-app = FastAPI(title="Weaviate Semantic Search")
+logger = logging.getLogger(__name__)
 
-# Setup templates and static files
-templates = Jinja2Templates(directory="templates")
-app.mount("/static", StaticFiles(directory="static"), name="static")
+PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# Batch search API limits
+MAX_BATCH_QUERIES = int(os.getenv("MAX_BATCH_QUERIES", "100"))
+BATCH_SEARCH_CONCURRENCY = int(os.getenv("BATCH_SEARCH_CONCURRENCY", "16"))
+
+# Bearer token for admin endpoints (POST /catalog/changed); unset disables them
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+
+# Maximum seconds between full catalog re-scans into the suggest index
+SUGGEST_REFRESH_SECONDS = float(os.getenv("SUGGEST_REFRESH_SECONDS", "600"))
+
+# Browser/CDN caching of result pages (seconds)
+HTTP_CACHE_MAX_AGE = int(os.getenv("HTTP_CACHE_MAX_AGE", "60"))
+
+# Rendered HTML keyed by ETag, so identical result pages are rendered once
+page_cache = QueryCache(
+    max_size=int(os.getenv("PAGE_CACHE_SIZE", "256")),
+    ttl=float(os.getenv("PAGE_CACHE_TTL", "300"))
+)
 
-# Initialize Weaviate client
-weaviate_client = WeaviateClient()
+# Async Weaviate client; the connection is opened in the lifespan handler
+weaviate_client = AsyncWeaviateClient()
 
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Close Weaviate connection on app shutdown."""
-    weaviate_client.close()
+async def _refresh_suggest_index(catalog_changed: asyncio.Event):
+    """Keep the typeahead index in step with the catalog.
+    
+    Streams the catalog out of Weaviate at startup, then again whenever
+    catalog_changed is set (POST /catalog/changed) and at least every
+    SUGGEST_REFRESH_SECONDS. Products inserted or deleted by other processes
+    therefore show up without a restart.
+    """
+    while True:
+        # Cleared before the scan, so a change during the scan triggers another one
+        catalog_changed.clear()
+        try:
+            await default_suggest_index.abuild(
+                weaviate_client.iter_products(return_properties=list(SUGGEST_FIELDS))
+            )
+        except Exception:
+            logger.exception("Error building suggest index")
+        try:
+            await asyncio.wait_for(catalog_changed.wait(), SUGGEST_REFRESH_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the Weaviate connection on startup and close it on shutdown.
+    
+    The suggest index is built and refreshed in the background, so the app
+    serves requests (with empty suggestions) while a large catalog is still
+    streaming in.
+    """
+    await weaviate_client.connect()
+    app.state.catalog_changed = asyncio.Event()
+    # Shared by all batch requests, so concurrent batches cannot multiply the load
+    app.state.batch_search_slots = asyncio.Semaphore(BATCH_SEARCH_CONCURRENCY)
+    suggest_build = asyncio.create_task(_refresh_suggest_index(app.state.catalog_changed))
+    try:
+        yield
+    finally:
+        # Stop the catalog scan before its connection goes away
+        suggest_build.cancel()
+        with suppress(asyncio.CancelledError):
+            await suggest_build
+        await weaviate_client.close()
+
+
+app = FastAPI(title="Weaviate Semantic Search", lifespan=lifespan)
+app.add_middleware(ServerTimingMiddleware)
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
+# Query cache counters, read when /metrics is scraped
+for _stat in ("hits", "misses", "coalesced", "evictions", "size"):
+    Gauge(f"query_cache_{_stat}", f"Query cache {_stat}").set_function(
+        lambda stat=_stat: weaviate_client.cache.stats()[stat]
+    )
+
+# Setup templates and static files
+templates = Jinja2Templates(directory="templates")
+app.mount("/static", StaticFiles(directory="static"), name="static")
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -33,27 +120,252 @@ async def home(request: Request):
 @app.post("/search")
 async def search(query: str = Form(...)):
     """Handle search query and redirect to products page."""
-    return RedirectResponse(url=f"/products?q={query}", status_code=303)
+    return RedirectResponse(url="/products?" + urlencode({"q": query}), status_code=303)
+
+
+def _render_cached(request: Request, template_name: str, context: Dict[str, Any]) -> Response:
+    """Render a template with ETag/Cache-Control headers.
+    
+    The ETag is derived from the template context (the results), before
+    rendering. A matching If-None-Match gets a 304 without rendering, and
+    identical pages requested again are served from page_cache.
+    """
+    fingerprint = repr((template_name, str(request.base_url), sorted(context.items())))
+    etag = 'W/"' + hashlib.blake2b(fingerprint.encode("utf-8"), digest_size=16).hexdigest() + '"'
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={HTTP_CACHE_MAX_AGE}"}
+    
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")) or if_none_match.strip() == "*":
+        return Response(status_code=304, headers=headers)
+    
+    with timed("render"):
+        html = page_cache.get_or_compute(
+            etag,
+            lambda: templates.get_template(template_name).render({"request": request, **context})
+        )
+    return HTMLResponse(html, headers=headers)
+
+
+def _parse_cursor(after: Optional[str]) -> Optional[str]:
+    """Validate the ``after`` cursor (an object UUID) before it reaches Weaviate."""
+    if not after:
+        return None
+    try:
+        return str(uuid.UUID(after))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="after must be a valid cursor")
+
+
+def _page_url(**params) -> str:
+    """Build a /products URL, dropping empty parameters."""
+    return "/products?" + urlencode({k: v for k, v in params.items() if v not in (None, "")})
+
+
+def _parse_price(name: str, value: Optional[str]) -> Optional[float]:
+    """Parse an optional price parameter; empty form fields mean "no bound"."""
+    if value is None or value.strip() == "":
+        return None
+    try:
+        price = float(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"{name} must be a number")
+    if price < 0:
+        raise HTTPException(status_code=400, detail=f"{name} must not be negative")
+    return price
 
 
 @app.get("/products", response_class=HTMLResponse)
-async def products(request: Request, q: Optional[str] = None):
-    """Display product search results."""
-    if q:
-        # Perform semantic search
-        products_list = weaviate_client.search_products(q, limit=20)
+async def products(
+    request: Request,
+    q: Optional[str] = None,
+    limit: int = Query(PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    after: Optional[str] = None,
+    category: Optional[str] = None,
+    brand: Optional[str] = None,
+    min_price: Optional[str] = None,
+    max_price: Optional[str] = None
+):
+    """Display product search results.
+    
+    Category, brand and price filters are applied by Weaviate, and facet counts
+    for the filtered catalog are fetched alongside the results. Search results
+    and filtered listings are paged with offset; browsing the unfiltered catalog
+    uses cursor pagination via ``after`` (the UUID of the previous page's last object).
+    """
+    filters = {
+        "category": category or None,
+        "brand": brand or None,
+        "min_price": _parse_price("min_price", min_price),
+        "max_price": _parse_price("max_price", max_price),
+    }
+    filters = {k: v for k, v in filters.items() if v is not None}
+    after = _parse_cursor(after)
+    
+    prev_url = None
+    next_url = None
+    
+    if q or filters:
+        if q:
+            # Perform semantic search
+            products_list, facets = await asyncio.gather(
+                weaviate_client.search_products(q, limit=limit, offset=offset, filters=filters),
+                weaviate_client.get_facets(filters)
+            )
+            SEARCH_RESULTS.labels(kind="search").observe(len(products_list))
+        else:
+            # Filtered listing (cursors cannot be combined with filters)
+            products_list, facets = await asyncio.gather(
+                weaviate_client.get_all_products(limit=limit, offset=offset, filters=filters),
+                weaviate_client.get_facets(filters)
+            )
+            SEARCH_RESULTS.labels(kind="browse").observe(len(products_list))
+        if offset > 0:
+            prev_url = _page_url(q=q, limit=limit, offset=max(offset - limit, 0), **filters)
+        if len(products_list) == limit:
+            next_url = _page_url(q=q, limit=limit, offset=offset + limit, **filters)
     else:
         # Show all products if no query
-        products_list = weaviate_client.get_all_products(limit=20)
+        (products_list, next_cursor), facets = await asyncio.gather(
+            weaviate_client.get_products_page(limit=limit, after=after),
+            weaviate_client.get_facets()
+        )
+        SEARCH_RESULTS.labels(kind="browse").observe(len(products_list))
+        if after:
+            # Cursors only move forward; go back to the first page
+            prev_url = _page_url(limit=limit)
+        if next_cursor:
+            next_url = _page_url(limit=limit, after=next_cursor)
     
-    return templates.TemplateResponse(
+    response = _render_cached(
+        request,
         "products.html",
         {
-            "request": request,
             "products": products_list,
-            "query": q or ""
+            "query": q or "",
+            "filters": filters,
+            "facets": facets,
+            "prev_url": prev_url,
+            "next_url": next_url
         }
     )
+    # Count each search once: not again when paging or revalidating it
+    if q and offset == 0 and response.status_code != 304:
+        default_suggest_index.record_search(q)
+    return response
+
+
+class SearchFilters(BaseModel):
+    """Filters for one query of a batch search."""
+    model_config = ConfigDict(extra="forbid")
+    
+    category: Optional[str] = None
+    brand: Optional[str] = None
+    min_price: Optional[float] = Field(None, ge=0)
+    max_price: Optional[float] = Field(None, ge=0)
+
+
+class SearchQuery(BaseModel):
+    """One query of a batch search."""
+    model_config = ConfigDict(extra="forbid")
+    
+    q: str = Field(..., min_length=1)
+    limit: int = Field(PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+    offset: int = Field(0, ge=0)
+    filters: Optional[SearchFilters] = None
+
+
+class BatchSearchRequest(BaseModel):
+    """Body of POST /api/search/batch."""
+    queries: List[SearchQuery] = Field(..., min_length=1, max_length=MAX_BATCH_QUERIES)
+
+
+@app.post("/api/search/batch", response_class=JSONResponse)
+async def batch_search(request: Request, body: BatchSearchRequest):
+    """Run many searches in one request.
+    
+    Queries run concurrently over the shared Weaviate connection, at most
+    BATCH_SEARCH_CONCURRENCY at a time across all batch requests, and go through the query cache, so repeated
+    queries in a batch cost one backend call. Results are returned in request order.
+    Each result has a ``status``: "ok" with its products, or "error" when that
+    query failed, so a failure is never reported as an empty match.
+    """
+    results = await weaviate_client.search_many(
+        [
+            {
+                "query": query.q,
+                "limit": query.limit,
+                "offset": query.offset,
+                "filters": query.filters.model_dump(exclude_none=True) if query.filters else None,
+            }
+            for query in body.queries
+        ],
+        semaphore=request.app.state.batch_search_slots
+    )
+    
+    response = []
+    for query, result in zip(body.queries, results):
+        if isinstance(result, Exception):
+            response.append({"q": query.q, "status": "error", "error": "search failed", "products": []})
+            continue
+        SEARCH_RESULTS.labels(kind="batch").observe(len(result))
+        response.append({"q": query.q, "status": "ok", "products": [product.to_dict() for product in result]})
+    
+    return {"results": response}
+
+
+@app.get("/suggest", response_class=JSONResponse)
+async def suggest(
+    q: str = Query("", max_length=200),
+    limit: int = Query(MAX_SUGGESTIONS, ge=1, le=MAX_SUGGESTIONS)
+):
+    """Typeahead completions (product names, brands and categories) for a prefix.
+    
+    Answered from the in-process suggest index, ranked by popularity, without
+    querying Weaviate.
+    """
+    with timed("suggest"):
+        suggestions = default_suggest_index.suggest(q, limit=limit)
+    return JSONResponse(
+        {"q": q, "suggestions": suggestions},
+        headers={"Cache-Control": f"public, max-age={HTTP_CACHE_MAX_AGE}"}
+    )
+
+
+def _require_admin(request: Request):
+    """Reject requests without the ADMIN_TOKEN bearer token."""
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled; set ADMIN_TOKEN")
+    authorization = request.headers.get("authorization", "")
+    if not hmac.compare_digest(authorization.encode("utf-8"), f"Bearer {ADMIN_TOKEN}".encode("utf-8")):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+
+@app.post("/catalog/changed", response_class=JSONResponse)
+async def catalog_changed(request: Request):
+    """Drop cached results after the catalog was written by another process.
+    
+    Called by the ingest/sync CLIs (see ingest.notify_app); the app itself never
+    writes, so without this its caches would serve pre-write results until
+    their TTL expires. Also triggers a re-scan of the suggest index.
+    """
+    _require_admin(request)
+    weaviate_client.cache.clear()
+    page_cache.clear()
+    request.app.state.catalog_changed.set()
+    return {"status": "ok"}
+
+
+@app.get("/cache/stats", response_class=JSONResponse)
+async def cache_stats():
+    """Query cache hit/miss counters, for sizing QUERY_CACHE_SIZE/QUERY_CACHE_TTL."""
+    return weaviate_client.cache.stats()
+
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus metrics: route latency, stage timings, Weaviate errors, result counts and ingest rates."""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
 
 
 if __name__ == "__main__":
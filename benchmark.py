@@ -0,0 +1,218 @@
+"""
+Offline latency/throughput benchmarks for app.py and weaviate_client.py.
+
+Weaviate is replaced by the in-memory fake from fake_weaviate.py, so this runs
+on any machine without network access. The HTTP benchmark calls the ASGI app
+directly (no sockets), so the numbers cover routing, the client code, the
+query cache and template rendering:
+
+    python benchmark.py --requests 2000 --concurrency 50 --latency-ms 5 --output benchmark_results.json
+"""
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode
+
+import app as app_module
+from fake_weaviate import FakeAsyncWeaviate, FakeWeaviate
+from generate_data import generate_products
+from metrics import percentile
+from query_cache import QueryCache
+from weaviate_client import AsyncWeaviateClient, WeaviateClient
+
+QUERIES = [
+    "milk", "healthy breakfast", "something sweet", "protein-rich foods", "fresh vegetables",
+    "gluten free snacks", "coffee", "frozen dinner", "cheese", "fruit for smoothies",
+]
+
+
+def summarize(latencies: List[float], elapsed: float, errors: int = 0) -> Dict[str, Any]:
+    """Latency percentiles (ms) and throughput for one scenario."""
+    latencies = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "elapsed_s": round(elapsed, 4),
+        "requests_per_s": round(len(latencies) / elapsed, 2) if elapsed > 0 else 0.0,
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3) if latencies else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3) if latencies else 0.0,
+    }
+
+
+async def asgi_get(asgi_app, url: str) -> int:
+    """Issue one GET against an ASGI app in-process and return the status code."""
+    path, _, query_string = url.partition("?")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query_string.encode(),
+        "root_path": "",
+        "headers": [(b"host", b"benchmark")],
+        "client": ("127.0.0.1", 0),
+        "server": ("benchmark", 80),
+    }
+    status = 500
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # Block like a real server until the client disconnects
+        await asyncio.Event().wait()
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await asgi_app(scope, receive, send)
+    return status
+
+
+async def run_http_load(urls: List[str], concurrency: int) -> Dict[str, Any]:
+    """Drive the app with concurrency workers until every URL has been requested once."""
+    queue: "asyncio.Queue[str]" = asyncio.Queue()
+    for url in urls:
+        queue.put_nowait(url)
+    latencies: List[float] = []
+    errors = 0
+
+    async def worker():
+        nonlocal errors
+        while True:
+            try:
+                url = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            start = time.perf_counter()
+            status = await asgi_get(app_module.app, url)
+            latencies.append(time.perf_counter() - start)
+            if status >= 400:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, time.perf_counter() - start, errors)
+
+
+def bench_http(products: List[Dict[str, Any]], requests: int, concurrency: int, latency: float) -> Dict[str, Any]:
+    """Benchmark /products for uncached search, cached search and catalog browsing.
+    
+    Each scenario gets fresh query and page caches; the uncached scenarios
+    disable both, so every request reaches the fake backend and renders.
+    """
+    scenarios = {
+        "search_uncached": (
+            QueryCache(max_size=0),
+            [f"/products?{urlencode({'q': QUERIES[i % len(QUERIES)]})}" for i in range(requests)],
+        ),
+        "search_cached": (
+            QueryCache(),
+            [f"/products?{urlencode({'q': QUERIES[i % len(QUERIES)]})}" for i in range(requests)],
+        ),
+        "browse": (
+            QueryCache(max_size=0),
+            ["/products?limit=20" for _ in range(requests)],
+        ),
+    }
+    results = {}
+    original_client = app_module.weaviate_client
+    original_page_cache = app_module.page_cache
+    try:
+        for name, (cache, urls) in scenarios.items():
+            app_module.weaviate_client = AsyncWeaviateClient(
+                client=FakeAsyncWeaviate(products, latency=latency),
+                cache=cache
+            )
+            app_module.page_cache = QueryCache(max_size=cache.max_size, ttl=cache.ttl)
+            results[name] = asyncio.run(run_http_load(urls, concurrency))
+            print(f"  {name}: {results[name]['requests_per_s']} req/s, "
+                  f"p50 {results[name]['p50_ms']}ms, p99 {results[name]['p99_ms']}ms")
+    finally:
+        app_module.weaviate_client = original_client
+        app_module.page_cache = original_page_cache
+    return results
+
+
+def bench_ingest(count: int, batch_sizes: List[int], latency: float) -> Dict[str, Any]:
+    """Measure insert_products throughput (objects/sec) for each batch size."""
+    products = list(generate_products(count, seed=7))
+    results = {}
+    for batch_size in batch_sizes:
+        client = WeaviateClient(client=FakeWeaviate(latency=latency), cache=QueryCache(max_size=0))
+        start = time.perf_counter()
+        client.insert_products(products, batch_size=batch_size)
+        elapsed = time.perf_counter() - start
+        results[str(batch_size)] = {
+            "objects": count,
+            "elapsed_s": round(elapsed, 4),
+            "objects_per_s": round(count / elapsed, 2) if elapsed > 0 else 0.0,
+        }
+        print(f"  batch_size={batch_size}: {results[str(batch_size)]['objects_per_s']} objects/s")
+    return results
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    """Run the benchmark suite and write the results as JSON."""
+    parser = argparse.ArgumentParser(description="Offline benchmarks against an in-memory Weaviate stand-in.")
+    parser.add_argument("--products", type=int, default=10000, help="Catalog size for the HTTP benchmark")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per HTTP scenario")
+    parser.add_argument("--concurrency", type=int, default=50, help="Concurrent in-flight requests")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Simulated Weaviate round-trip latency")
+    parser.add_argument("--ingest-count", type=int, default=20000, help="Objects inserted per ingest run")
+    parser.add_argument("--batch-sizes", default="50,100,200,500,1000", help="Comma-separated ingest batch sizes")
+    parser.add_argument("--output", default="benchmark_results.json", help="Where to write the JSON results")
+    args = parser.parse_args()
+
+    latency = args.latency_ms / 1000
+    batch_sizes = [int(size) for size in args.batch_sizes.split(",") if size]
+
+    print(f"HTTP /products ({args.requests} requests, concurrency {args.concurrency}, "
+          f"{args.latency_ms}ms simulated latency)...")
+    products = list(generate_products(args.products, seed=42))
+    http_results = bench_http(products, args.requests, args.concurrency, latency)
+
+    print(f"Ingestion ({args.ingest_count} objects per batch size)...")
+    ingest_results = bench_ingest(args.ingest_count, batch_sizes, latency)
+
+    results = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": vars(args),
+        "http": http_results,
+        "ingest": ingest_results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Deterministic object IDs and change detection for incremental catalog sync.
+
+Every product gets a UUID derived from its key (``sku`` if present, otherwise
+name + brand) and a hash of its content, stored in the ``content_hash``
+property. Re-inserting a product therefore overwrites it instead of creating a
+duplicate, and WeaviateClient.sync_products only sends products whose hash
+changed:
+
+    python catalog_sync.py catalog.jsonl
+"""
+import argparse
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Dict
+
+from weaviate.util import generate_uuid5
+
+from metrics import METRICS_PORT_HELP, serve_metrics
+
+# Property holding the content hash of each stored product
+CONTENT_HASH_PROPERTY = "content_hash"
+
+# Properties covered by the content hash; other keys (e.g. sku) are ignored
+HASHED_FIELDS = ("name", "description", "price", "category", "brand", "image_url")
+
+
+def product_key(product: Dict[str, Any]) -> str:
+    """Stable identity of a product: its SKU, or name + brand when there is none."""
+    if product.get("sku"):
+        return f"sku:{product['sku']}"
+    name = " ".join(str(product.get("name", "")).lower().split())
+    brand = " ".join(str(product.get("brand", "")).lower().split())
+    return f"{name}|{brand}"
+
+
+def product_uuid(product: Dict[str, Any]) -> str:
+    """Deterministic UUID (v5) for a product, derived from product_key."""
+    return generate_uuid5(product_key(product))
+
+
+def content_hash(product: Dict[str, Any]) -> str:
+    """Hash of the product's stored content, used to skip unchanged products."""
+    content = {name: product.get(name) for name in HASHED_FIELDS}
+    encoded = json.dumps(content, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def with_content_hash(product: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of the product's properties with content_hash set (sku is not stored)."""
+    properties = {name: value for name, value in product.items() if name != "sku"}
+    properties[CONTENT_HASH_PROPERTY] = content_hash(product)
+    return properties
+
+
+@dataclass
+class SyncStats:
+    """Counters reported by WeaviateClient.sync_products."""
+
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+    failed: int = 0
+
+    def summary(self) -> str:
+        return (f"{self.created} created, {self.updated} updated, {self.unchanged} unchanged, "
+                f"{self.deleted} deleted, {self.failed} failed")
+
+
+def main():
+    """Sync a JSONL/CSV catalog into Weaviate, sending only what changed."""
+    from ingest import APP_URL_HELP, notify_app, read_products
+    from weaviate_client import WeaviateClient
+
+    parser = argparse.ArgumentParser(description="Incrementally sync a product catalog into Weaviate.")
+    parser.add_argument("path", help="Catalog file (.jsonl, .ndjson or .csv)")
+    parser.add_argument("--batch-size", type=int, default=200, help="Objects per batch request")
+    parser.add_argument("--concurrency", type=int, default=2, help="Concurrent batch requests")
+    parser.add_argument("--keep-missing", action="store_true",
+                        help="Do not delete products that are absent from the catalog")
+    parser.add_argument("--metrics-port", type=int, help=METRICS_PORT_HELP)
+    parser.add_argument("--app-url", help=APP_URL_HELP)
+    args = parser.parse_args()
+    serve_metrics(args.metrics_port)
+
+    with WeaviateClient() as client:
+        client.initialize_schema()
+        client.sync_products(
+            read_products(args.path),
+            batch_size=args.batch_size,
+            concurrent_requests=args.concurrency,
+            delete_missing=not args.keep_missing
+        )
+    notify_app(args.app_url)
+
+
+if __name__ == "__main__":
+    main()
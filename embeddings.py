@@ -0,0 +1,112 @@
+"""
+Client-side text embedders for collections without a server-side vectorizer.
+
+With EMBEDDER=hashing, products and queries are embedded locally in
+vectorized NumPy batches, so ingest and search run fully offline without
+calling an external embedding API.
+"""
+import os
+import re
+import zlib
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Product properties embedded for each object, in order
+EMBEDDED_FIELDS = ("name", "brand", "category", "description")
+
+
+def product_text(product: Dict[str, Any]) -> str:
+    """Text that represents a product in vector space."""
+    return ". ".join(str(product[name]) for name in EMBEDDED_FIELDS if product.get(name))
+
+
+class Embedder(ABC):
+    """Base class of local embedders passed to WeaviateClient as ``embedder``.
+
+    Subclasses implement ``embed`` and set ``dim``; ``embed_products`` is
+    derived from ``embed``.
+    """
+
+    dim: int
+
+    @abstractmethod
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Return a (len(texts), dim) float32 matrix of L2-normalized vectors."""
+
+    def embed_products(self, products: Sequence[Dict[str, Any]]) -> np.ndarray:
+        """Embed a batch of product dicts."""
+        return self.embed([product_text(product) for product in products])
+
+
+@lru_cache(maxsize=1 << 18)
+def _hash_token(token: str, dim: int):
+    """Bucket and sign of a token (crc32 is stable across processes, unlike hash())."""
+    h = zlib.crc32(token.encode("utf-8"))
+    return h % dim, 1.0 if (h >> 31) & 1 else -1.0
+
+
+class HashingEmbedder(Embedder):
+    """Signed feature-hashing projection of words and word bigrams.
+
+    Term counts are dampened with log1p (a TF weighting) and rows are
+    L2-normalized, so dot products are cosine similarities. The whole batch is
+    scattered into one matrix with a single ``np.add.at`` call.
+    """
+
+    def __init__(self, dim: int = 512, bigrams: bool = True):
+        """
+        Args:
+            dim: Vector dimensionality (number of hash buckets).
+            bigrams: Also hash adjacent word pairs.
+        """
+        self.dim = dim
+        self.bigrams = bigrams
+
+    def _features(self, text: str) -> List[str]:
+        tokens = _TOKEN_RE.findall(text.lower())
+        if self.bigrams:
+            tokens += [f"{a}_{b}" for a, b in zip(tokens, tokens[1:])]
+        return tokens
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        rows: List[int] = []
+        cols: List[int] = []
+        signs: List[float] = []
+        for row, text in enumerate(texts):
+            for token in self._features(text):
+                col, sign = _hash_token(token, self.dim)
+                rows.append(row)
+                cols.append(col)
+                signs.append(sign)
+
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        if rows:
+            np.add.at(matrix, (np.asarray(rows), np.asarray(cols)), np.asarray(signs, dtype=np.float32))
+        # Sublinear TF: keep the sign, dampen repeated terms
+        np.copysign(np.log1p(np.abs(matrix)), matrix, out=matrix)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix
+
+
+EMBEDDERS = {
+    "hashing": HashingEmbedder,
+}
+
+
+def embedder_from_env() -> Optional[Embedder]:
+    """Create the embedder named by EMBEDDER (dimension from EMBEDDING_DIM).
+
+    Returns None when EMBEDDER is unset, meaning Weaviate vectorizes server-side.
+    """
+    name = os.getenv("EMBEDDER")
+    if not name:
+        return None
+    if name not in EMBEDDERS:
+        raise ValueError(f"Unknown EMBEDDER '{name}'. Available: {', '.join(sorted(EMBEDDERS))}")
+    return EMBEDDERS[name](dim=int(os.getenv("EMBEDDING_DIM", "512")))
@@ -0,0 +1,339 @@
+"""
+In-memory stand-in for the Weaviate v4 client, for offline benchmarks.
+
+Implements the subset of the v4 API used by weaviate_client.py (collections,
+filtered hybrid/fetch_objects queries, facet aggregates, cursor iteration,
+batching and delete_many) with a configurable simulated round-trip latency
+and, optionally, simulated batch write failures. Pass an instance as the ``client``
+argument of WeaviateClient / AsyncWeaviateClient:
+
+    client = WeaviateClient(client=FakeWeaviate(products, latency=0.005))
+    client = AsyncWeaviateClient(client=FakeAsyncWeaviate(products, latency=0.005))
+"""
+import asyncio
+import json
+import operator
+import time
+import uuid
+from collections import Counter
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, List, Optional
+
+# Deterministic IDs so cursors are stable between runs
+_NAMESPACE = uuid.UUID("6f1c1f44-3c7a-4f4e-9d0b-3e2d1c0b9a87")
+
+
+# Comparison for each supported v4 filter operator name
+_OPERATORS = {
+    "EQUAL": operator.eq,
+    "NOT_EQUAL": operator.ne,
+    "GREATER_THAN": operator.gt,
+    "GREATER_THAN_EQUAL": operator.ge,
+    "LESS_THAN": operator.lt,
+    "LESS_THAN_EQUAL": operator.le,
+}
+
+
+def _matches(obj: "FakeObject", filters) -> bool:
+    """Evaluate a v4 property/ID filter (single conditions combined with AND/OR)."""
+    if filters is None:
+        return True
+    if hasattr(filters, "filters"):
+        results = (_matches(obj, f) for f in filters.filters)
+        return any(results) if type(filters).__name__ == "_FilterOr" else all(results)
+    if filters.target == "_id":
+        value = str(obj.uuid)
+    else:
+        value = obj.properties.get(filters.target)
+    if filters.operator.name == "CONTAINS_ANY":
+        return value in {str(v) for v in filters.value}
+    return value is not None and _OPERATORS[filters.operator.name](value, filters.value)
+
+
+class FakeObject:
+    """A stored object as returned by the query API."""
+
+    __slots__ = ("uuid", "properties", "vector", "metadata")
+
+    def __init__(self, object_uuid: uuid.UUID, properties: Dict[str, Any], vector=None):
+        self.uuid = object_uuid
+        self.properties = properties
+        self.vector = vector
+        self.metadata = None
+
+
+def _project(obj: FakeObject, return_properties: Optional[List[str]]) -> FakeObject:
+    """The object with only return_properties (all of them when None)."""
+    if return_properties is None:
+        return obj
+    properties = {name: obj.properties[name] for name in return_properties if name in obj.properties}
+    return FakeObject(obj.uuid, properties, obj.vector)
+
+
+class _FakeResponse:
+    __slots__ = ("objects",)
+
+    def __init__(self, objects: List[FakeObject]):
+        self.objects = objects
+
+
+class _FakeStore:
+    """Objects of one collection, in insertion order.
+
+    Batch writes of each object ID are rejected write_failures times before
+    they are stored, to exercise retries.
+    """
+
+    def __init__(self, products: Iterable[Dict[str, Any]] = (), write_failures: int = 0):
+        self.objects: List[FakeObject] = []
+        self.index: Dict[uuid.UUID, int] = {}
+        self.write_failures = write_failures
+        self.rejections: Counter = Counter()
+        for product in products:
+            self.put(product)
+
+    def reject(self, object_uuid) -> bool:
+        """Whether the next batch write of object_uuid fails."""
+        if self.rejections[object_uuid] >= self.write_failures:
+            return False
+        self.rejections[object_uuid] += 1
+        return True
+
+    def put(self, properties: Dict[str, Any], object_uuid=None, vector=None):
+        if object_uuid is None:
+            object_uuid = uuid.uuid5(_NAMESPACE, str(len(self.objects)))
+        obj = FakeObject(uuid.UUID(str(object_uuid)), properties, vector)
+        if obj.uuid in self.index:
+            self.objects[self.index[obj.uuid]] = obj
+        else:
+            self.index[obj.uuid] = len(self.objects)
+            self.objects.append(obj)
+
+    def page(self, limit: Optional[int], offset: Optional[int] = None, after=None, filters=None) -> List[FakeObject]:
+        start = offset or 0
+        if after is not None:
+            start = self.index[uuid.UUID(str(after))] + 1
+        if filters is None:
+            return self.objects[start:start + (limit or 10)]
+        matching = [obj for obj in self.objects if _matches(obj, filters)]
+        return matching[start:start + (limit or 10)]
+
+    def delete(self, filters) -> int:
+        """Remove matching objects and return how many were deleted."""
+        kept = [obj for obj in self.objects if not _matches(obj, filters)]
+        deleted = len(self.objects) - len(kept)
+        self.objects = kept
+        self.index = {obj.uuid: i for i, obj in enumerate(kept)}
+        return deleted
+
+    def aggregate(self, filters=None, return_metrics=None, **kwargs):
+        """Total count plus top occurrences for each requested text metric."""
+        matching = [obj for obj in self.objects if _matches(obj, filters)]
+        properties = {}
+        for metric in return_metrics or []:
+            counts = Counter(obj.properties.get(metric.property_name) for obj in matching)
+            properties[metric.property_name] = SimpleNamespace(top_occurrences=[
+                SimpleNamespace(value=value, count=count)
+                for value, count in counts.most_common(metric.limit)
+            ])
+        return SimpleNamespace(total_count=len(matching), properties=properties)
+
+
+class _FakeBatch:
+    """Client-side batcher; every flush of batch_size objects costs one round trip."""
+
+    def __init__(self, store: _FakeStore, latency: float):
+        self._store = store
+        self._latency = latency
+        self._batch_size = 100
+        self._pending: List[Dict[str, Any]] = []
+        self.failed_objects: List[Any] = []
+
+    def dynamic(self) -> "_FakeBatch":
+        return self.fixed_size(100)
+
+    def fixed_size(self, batch_size: int = 100, concurrent_requests: int = 2) -> "_FakeBatch":
+        self._batch_size = batch_size
+        self._pending = []
+        self.failed_objects = []
+        return self
+
+    def __enter__(self) -> "_FakeBatch":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._flush()
+
+    def add_object(self, properties: Dict[str, Any], uuid=None, vector=None, **kwargs):
+        self._pending.append({"properties": properties, "uuid": uuid, "vector": vector})
+        if len(self._pending) >= self._batch_size:
+            self._flush()
+
+    def _flush(self):
+        if not self._pending:
+            return
+        # Serialize the payload like a real request would, then pay one round trip
+        json.dumps([item["properties"] for item in self._pending])
+        time.sleep(self._latency)
+        for item in self._pending:
+            if self._store.reject(item["uuid"]):
+                self.failed_objects.append(SimpleNamespace(
+                    object_=SimpleNamespace(**item), message="simulated batch failure"
+                ))
+            else:
+                self._store.put(item["properties"], item["uuid"], item["vector"])
+        self._pending = []
+
+
+class _FakeQuery:
+    def __init__(self, store: _FakeStore, latency: float):
+        self._store = store
+        self._latency = latency
+
+    def hybrid(self, query: str, limit: Optional[int] = None, offset: Optional[int] = None,
+               filters=None, **kwargs) -> _FakeResponse:
+        time.sleep(self._latency)
+        return _FakeResponse(self._store.page(limit, offset, filters=filters))
+
+    def fetch_objects(self, limit: Optional[int] = None, offset: Optional[int] = None, after=None,
+                      filters=None, **kwargs) -> _FakeResponse:
+        time.sleep(self._latency)
+        return _FakeResponse(self._store.page(limit, offset, after, filters))
+
+
+class _FakeAsyncQuery:
+    def __init__(self, store: _FakeStore, latency: float):
+        self._store = store
+        self._latency = latency
+
+    async def hybrid(self, query: str, limit: Optional[int] = None, offset: Optional[int] = None,
+                     filters=None, **kwargs) -> _FakeResponse:
+        await asyncio.sleep(self._latency)
+        return _FakeResponse(self._store.page(limit, offset, filters=filters))
+
+    async def fetch_objects(self, limit: Optional[int] = None, offset: Optional[int] = None, after=None,
+                            filters=None, **kwargs) -> _FakeResponse:
+        await asyncio.sleep(self._latency)
+        return _FakeResponse(self._store.page(limit, offset, after, filters))
+
+
+class _FakeData:
+    def __init__(self, store: _FakeStore, latency: float):
+        self._store = store
+        self._latency = latency
+
+    def delete_many(self, where, **kwargs):
+        time.sleep(self._latency)
+        return SimpleNamespace(successful=self._store.delete(where), failed=0)
+
+
+class _FakeAggregate:
+    def __init__(self, store: _FakeStore, latency: float):
+        self._store = store
+        self._latency = latency
+
+    def over_all(self, filters=None, return_metrics=None, **kwargs):
+        time.sleep(self._latency)
+        return self._store.aggregate(filters, return_metrics)
+
+
+class _FakeAsyncAggregate(_FakeAggregate):
+    async def over_all(self, filters=None, return_metrics=None, **kwargs):
+        await asyncio.sleep(self._latency)
+        return self._store.aggregate(filters, return_metrics)
+
+
+class _FakeCollection:
+    def __init__(self, store: _FakeStore, latency: float):
+        self._store = store
+        self._latency = latency
+        self.query = _FakeQuery(store, latency)
+        self.aggregate = _FakeAggregate(store, latency)
+        self.batch = _FakeBatch(store, latency)
+        self.data = _FakeData(store, latency)
+
+    def iterator(self, return_properties: Optional[List[str]] = None, cache_size: Optional[int] = None,
+                 **kwargs):
+        cache_size = cache_size or 100
+        for start in range(0, len(self._store.objects), cache_size):
+            time.sleep(self._latency)
+            for obj in self._store.objects[start:start + cache_size]:
+                yield _project(obj, return_properties)
+
+
+class _FakeAsyncCollection(_FakeCollection):
+    def __init__(self, store: _FakeStore, latency: float):
+        super().__init__(store, latency)
+        self.query = _FakeAsyncQuery(store, latency)
+        self.aggregate = _FakeAsyncAggregate(store, latency)
+
+    async def iterator(self, return_properties: Optional[List[str]] = None, cache_size: Optional[int] = None,
+                       **kwargs):
+        cache_size = cache_size or 100
+        for start in range(0, len(self._store.objects), cache_size):
+            await asyncio.sleep(self._latency)
+            for obj in self._store.objects[start:start + cache_size]:
+                yield _project(obj, return_properties)
+
+
+class _FakeCollections:
+    def __init__(self, owner: "FakeWeaviate"):
+        self._owner = owner
+
+    def exists(self, name: str) -> bool:
+        return name in self._owner.stores
+
+    def create(self, name: str, **kwargs):
+        self._owner.stores.setdefault(name, _FakeStore())
+        self._owner.configs[name] = kwargs
+
+    def delete(self, name: str):
+        self._owner.stores.pop(name, None)
+        self._owner.configs.pop(name, None)
+
+    def get(self, name: str) -> _FakeCollection:
+        store = self._owner.stores.setdefault(name, _FakeStore())
+        return self._owner.collection_class(store, self._owner.latency)
+
+
+class FakeWeaviate:
+    """Synchronous in-memory stand-in for ``weaviate.WeaviateClient``."""
+
+    collection_class = _FakeCollection
+
+    def __init__(self, products: Iterable[Dict[str, Any]] = (), latency: float = 0.0,
+                 collection_name: str = "Product", batch_failures: int = 0):
+        """Create a fake holding products in one collection.
+
+        Args:
+            products: Initial objects of the collection.
+            latency: Simulated seconds per round trip (query, page or batch flush).
+            collection_name: Name of the pre-populated collection.
+            batch_failures: Times a batch write of each object ID to that
+                collection is reported in failed_objects before it succeeds.
+        """
+        self.latency = latency
+        self.stores: Dict[str, _FakeStore] = {collection_name: _FakeStore(products, batch_failures)}
+        self.configs: Dict[str, Dict[str, Any]] = {}
+        self.collections = _FakeCollections(self)
+
+    def is_connected(self) -> bool:
+        return True
+
+    def connect(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakeAsyncWeaviate(FakeWeaviate):
+    """Async in-memory stand-in for ``weaviate.WeaviateAsyncClient``."""
+
+    collection_class = _FakeAsyncCollection
+
+    async def connect(self):
+        pass
+
+    async def close(self):
+        pass
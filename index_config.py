@@ -0,0 +1,85 @@
+"""
+HNSW vector index and compression settings for the Product collection.
+
+Settings come from the environment (or are passed to WeaviateClient as
+``index_settings``); anything left unset uses Weaviate's server default:
+
+- HNSW_EF: query-time candidate list size (-1 = dynamic)
+- HNSW_EF_CONSTRUCTION: build-time candidate list size
+- HNSW_MAX_CONNECTIONS: graph out-degree per node
+- VECTOR_COMPRESSION: none, pq, bq or sq
+- VECTOR_COMPRESSION_TRAINING_LIMIT: objects used to train PQ/SQ
+- PQ_SEGMENTS: PQ code length in bytes per vector
+"""
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+from weaviate.classes.config import Configure, Reconfigure
+
+COMPRESSIONS = ("none", "pq", "bq", "sq")
+
+
+def _env_int(name: str) -> Optional[int]:
+    value = os.getenv(name)
+    return int(value) if value else None
+
+
+@dataclass
+class VectorIndexSettings:
+    """HNSW parameters and optional vector compression."""
+
+    ef: Optional[int] = None
+    ef_construction: Optional[int] = None
+    max_connections: Optional[int] = None
+    compression: str = "none"
+    training_limit: Optional[int] = None
+    pq_segments: Optional[int] = None
+
+    def __post_init__(self):
+        if self.compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression '{self.compression}'. Use one of: {', '.join(COMPRESSIONS)}")
+
+    @classmethod
+    def from_env(cls) -> "VectorIndexSettings":
+        """Read settings from the HNSW_* and VECTOR_COMPRESSION* variables."""
+        return cls(
+            ef=_env_int("HNSW_EF"),
+            ef_construction=_env_int("HNSW_EF_CONSTRUCTION"),
+            max_connections=_env_int("HNSW_MAX_CONNECTIONS"),
+            compression=os.getenv("VECTOR_COMPRESSION", "none").lower(),
+            training_limit=_env_int("VECTOR_COMPRESSION_TRAINING_LIMIT"),
+            pq_segments=_env_int("PQ_SEGMENTS"),
+        )
+
+    def label(self) -> str:
+        """Short human-readable description, e.g. for sweep reports."""
+        return (f"ef={self.ef if self.ef is not None else 'default'} "
+                f"efC={self.ef_construction if self.ef_construction is not None else 'default'} "
+                f"M={self.max_connections if self.max_connections is not None else 'default'} "
+                f"compression={self.compression}")
+
+    def _quantizer(self):
+        if self.compression == "pq":
+            return Configure.VectorIndex.Quantizer.pq(segments=self.pq_segments, training_limit=self.training_limit)
+        if self.compression == "bq":
+            return Configure.VectorIndex.Quantizer.bq()
+        if self.compression == "sq":
+            return Configure.VectorIndex.Quantizer.sq(training_limit=self.training_limit)
+        return None
+
+    def to_config(self):
+        """Vector index config for collections.create()."""
+        return Configure.VectorIndex.hnsw(
+            ef=self.ef,
+            ef_construction=self.ef_construction,
+            max_connections=self.max_connections,
+            quantizer=self._quantizer(),
+        )
+
+    def to_update(self):
+        """Reconfiguration of the query-time parameters of an existing collection.
+
+        efConstruction and maxConnections are fixed when the index is built.
+        """
+        return Reconfigure.VectorIndex.hnsw(ef=self.ef)
@@ -0,0 +1,196 @@
+"""
+Recall/latency/memory sweep over HNSW and vector compression settings.
+
+Builds a scratch collection of generated products for every combination of
+efConstruction, maxConnections and compression, then runs near-vector
+queries at each ef and compares the results with exact (brute-force NumPy)
+nearest neighbours. Vectors come from the local HashingEmbedder, so the
+ground truth is computed on exactly the vectors Weaviate indexes. Generated
+products repeat texts, so many vectors tie; a returned object counts as a hit
+when it is at least as similar as the exact k-th neighbour. Needs a
+running Weaviate (WEAVIATE_URL); the scratch collection is deleted afterwards:
+
+    python index_sweep.py --count 50000 --ef 16 64 128 256 --compression none pq bq sq
+"""
+import argparse
+import json
+import time
+import urllib.request
+from datetime import datetime, timezone
+from itertools import product as combinations
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from catalog_sync import product_uuid
+from embeddings import HashingEmbedder
+from generate_data import generate_products
+from index_config import VectorIndexSettings
+from metrics import percentile
+from weaviate_client import WeaviateClient
+
+SWEEP_COLLECTION = "ProductSweep"
+
+# Similarity slack for float32 rounding differences between NumPy and Weaviate
+TIE_TOLERANCE = 1e-5
+
+
+def kth_similarities(vectors: np.ndarray, queries: np.ndarray, k: int, chunk_size: int = 256) -> np.ndarray:
+    """Exact similarity of the k-th most similar row of vectors for every query (cosine)."""
+    result = np.empty(len(queries), dtype=np.float32)
+    for start in range(0, len(queries), chunk_size):
+        scores = queries[start:start + chunk_size] @ vectors.T
+        result[start:start + chunk_size] = -np.partition(-scores, k - 1, axis=1)[:, k - 1]
+    return result
+
+
+def estimate_index_bytes(settings: VectorIndexSettings, count: int, dim: int) -> Optional[int]:
+    """Rough in-memory size of the vector index: cached vectors plus the base HNSW layer.
+
+    Returns None for PQ without an explicit segment count, whose code size is
+    chosen by the server.
+    """
+    if settings.compression == "none":
+        vector_bytes = 4 * dim
+    elif settings.compression == "sq":
+        vector_bytes = dim
+    elif settings.compression == "bq":
+        vector_bytes = -(-dim // 64) * 8
+    elif settings.pq_segments:
+        vector_bytes = settings.pq_segments
+    else:
+        return None
+    # Layer 0 keeps up to 2 * maxConnections neighbour IDs (uint64) per node
+    graph_bytes = 2 * settings.max_connections * 8
+    return count * (vector_bytes + graph_bytes)
+
+
+def heap_inuse_bytes(metrics_url: str) -> Optional[int]:
+    """Weaviate's Go heap usage from its Prometheus endpoint, if reachable."""
+    try:
+        with urllib.request.urlopen(metrics_url, timeout=5) as response:
+            for line in response.read().decode("utf-8").splitlines():
+                if line.startswith("go_memstats_heap_inuse_bytes "):
+                    return int(float(line.split()[1]))
+    except OSError as e:
+        print(f"Could not read {metrics_url}: {e}")
+    return None
+
+
+def run_queries(collection, queries: np.ndarray, vectors: np.ndarray, rows: Dict[str, int], kth: np.ndarray,
+                k: int, warmup: int = 20) -> Dict[str, Any]:
+    """Recall@k and latency percentiles of near-vector queries against one index.
+
+    A returned object is a hit if its exact similarity to the query reaches
+    kth (see kth_similarities), so any of several equally similar products
+    counts as a true neighbour. rows maps object UUIDs to rows of vectors.
+    """
+    for vector in queries[:warmup]:
+        collection.query.near_vector(near_vector=vector.tolist(), limit=k, return_properties=[])
+
+    latencies = []
+    hits = 0
+    for vector, threshold in zip(queries, kth):
+        start = time.perf_counter()
+        response = collection.query.near_vector(near_vector=vector.tolist(), limit=k, return_properties=[])
+        latencies.append(time.perf_counter() - start)
+        returned = [rows[str(obj.uuid)] for obj in response.objects]
+        hits += int(np.count_nonzero(vectors[returned] @ vector >= threshold - TIE_TOLERANCE))
+
+    latencies.sort()
+    return {
+        "recall_at_k": round(hits / (len(queries) * k), 4),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+    }
+
+
+def main():
+    """Sweep index settings and write recall, latency and memory per combination."""
+    parser = argparse.ArgumentParser(description="Measure recall/latency/memory across HNSW and compression settings.")
+    parser.add_argument("--count", type=int, default=50000, help="Products to index")
+    parser.add_argument("--queries", type=int, default=500, help="Held-out query vectors")
+    parser.add_argument("--k", type=int, default=10, help="Neighbours per query (recall@k)")
+    parser.add_argument("--dim", type=int, default=512, help="Embedding dimensionality")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for the generated catalog")
+    parser.add_argument("--ef", type=int, nargs="+", default=[16, 32, 64, 128, 256], help="Query-time ef values")
+    parser.add_argument("--ef-construction", type=int, nargs="+", default=[128], help="efConstruction values")
+    parser.add_argument("--max-connections", type=int, nargs="+", default=[32], help="maxConnections values")
+    parser.add_argument("--compression", nargs="+", default=["none", "pq", "bq", "sq"],
+                        help="Compression modes (none, pq, bq, sq)")
+    parser.add_argument("--training-limit", type=int, default=None,
+                        help="PQ/SQ training objects (default: half the catalog, at most 100000)")
+    parser.add_argument("--pq-segments", type=int, default=None, help="PQ segments (default: server's choice)")
+    parser.add_argument("--metrics-url", default=None,
+                        help="Weaviate Prometheus endpoint (e.g. http://localhost:2112/metrics) to record heap usage")
+    parser.add_argument("--output", default="index_sweep_results.json", help="Where to write the JSON results")
+    args = parser.parse_args()
+
+    embedder = HashingEmbedder(dim=args.dim)
+    products = list(generate_products(args.count, seed=args.seed))
+    rows = {str(product_uuid(product)): row for row, product in enumerate(products)}
+    print(f"Embedding {len(products)} products and {args.queries} queries...")
+    vectors = np.concatenate([embedder.embed_products(products[start:start + 10000])
+                              for start in range(0, len(products), 10000)])
+    queries = embedder.embed_products(list(generate_products(args.queries, seed=args.seed + 1)))
+    kth = kth_similarities(vectors, queries, args.k)
+    training_limit = args.training_limit or min(len(products) // 2, 100000)
+
+    results = []
+    for ef_construction, max_connections, compression in combinations(
+            args.ef_construction, args.max_connections, args.compression):
+        settings = VectorIndexSettings(
+            ef=args.ef[0],
+            ef_construction=ef_construction,
+            max_connections=max_connections,
+            compression=compression,
+            training_limit=training_limit,
+            pq_segments=args.pq_segments,
+        )
+        with WeaviateClient(embedder=embedder, index_settings=settings) as client:
+            client.collection_name = SWEEP_COLLECTION
+            client.client.collections.delete(SWEEP_COLLECTION)
+            heap_before = heap_inuse_bytes(args.metrics_url) if args.metrics_url else None
+            try:
+                client.initialize_schema()
+                stats = client.ingest_products(products, progress=False)
+                if stats.failed:
+                    # Recall would be measured against objects that are not indexed
+                    raise SystemExit(f"{len(stats.failed)} products failed to ingest "
+                                     f"({stats.failed[0]['error']}); aborting the sweep.")
+                heap_after = heap_inuse_bytes(args.metrics_url) if args.metrics_url else None
+                collection = client.client.collections.get(SWEEP_COLLECTION)
+
+                for ef in args.ef:
+                    settings.ef = ef
+                    client.update_index_settings()
+                    row = {
+                        "ef": ef,
+                        "ef_construction": ef_construction,
+                        "max_connections": max_connections,
+                        "compression": compression,
+                        "build_s": round(stats.elapsed, 2),
+                        "estimated_index_bytes": estimate_index_bytes(settings, len(products), args.dim),
+                        "heap_growth_bytes": (heap_after - heap_before
+                                              if heap_before is not None and heap_after is not None else None),
+                        **run_queries(collection, queries, vectors, rows, kth, args.k),
+                    }
+                    results.append(row)
+                    print(f"{settings.label()}: recall@{args.k}={row['recall_at_k']:.3f} "
+                          f"p99={row['p99_ms']:.2f} ms")
+            finally:
+                client.client.collections.delete(SWEEP_COLLECTION)
+
+    report = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "config": {key: value for key, value in vars(args).items() if key != "output"},
+        "objects": len(products),
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
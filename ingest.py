@@ -0,0 +1,195 @@
+"""
+Streaming, resumable bulk ingestion of product catalogs into Weaviate.
+
+Reads JSONL or CSV files lazily so catalogs of any size can be loaded in
+constant memory:
+
+    python ingest.py catalog.jsonl --batch-size 500 --concurrency 4 --checkpoint catalog.ckpt
+"""
+import argparse
+import csv
+import json
+import os
+import time
+import urllib.request
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+from metrics import METRICS_PORT_HELP, serve_metrics
+
+# Help text of the --app-url option shared by the ingest CLIs
+APP_URL_HELP = "Running app to notify after the load so it drops cached results (default: APP_URL)"
+
+# Columns converted from text when reading CSV files
+NUMERIC_FIELDS = ("price",)
+
+
+def read_jsonl(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield one product per non-empty line of a JSONL file."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def read_csv(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield one product per row of a CSV file with a header row."""
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            for name in NUMERIC_FIELDS:
+                if row.get(name):
+                    row[name] = float(row[name])
+            yield row
+
+
+def read_products(path: str) -> Iterator[Dict[str, Any]]:
+    """Lazily read products from a .jsonl/.ndjson or .csv file."""
+    if path.endswith(".csv"):
+        return read_csv(path)
+    if path.endswith((".jsonl", ".ndjson")):
+        return read_jsonl(path)
+    raise ValueError(f"Unsupported catalog format: {path} (expected .jsonl, .ndjson or .csv)")
+
+
+def notify_app(app_url: Optional[str] = None, token: Optional[str] = None) -> bool:
+    """Tell a running app that the catalog changed.
+
+    Loads run in CLI processes, while the query and page caches live in the
+    app, so the app is told via POST /catalog/changed. Does nothing when no
+    URL is given and APP_URL is unset.
+
+    Args:
+        app_url: Base URL of the app, e.g. http://localhost:8000. Defaults to APP_URL.
+        token: Admin token. Defaults to ADMIN_TOKEN.
+
+    Returns:
+        True if the app acknowledged the change.
+    """
+    app_url = app_url or os.getenv("APP_URL")
+    if not app_url:
+        return False
+    token = token if token is not None else os.getenv("ADMIN_TOKEN", "")
+    request = urllib.request.Request(
+        app_url.rstrip("/") + "/catalog/changed",
+        method="POST",
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=10):
+            pass
+    except OSError as e:
+        print(f"Could not notify {app_url} of the catalog change: {e}")
+        return False
+    print(f"Notified {app_url} of the catalog change.")
+    return True
+
+
+class Checkpoint:
+    """Number of source rows already committed, persisted to a small JSON file."""
+
+    def __init__(self, path: str, source: str = None):
+        """Load the checkpoint at path, if any.
+
+        Args:
+            path: Checkpoint file location.
+            source: Identifies the input (e.g. its file path). A checkpoint
+                written for a different source is ignored.
+        """
+        self.path = path
+        self.source = source
+        self.offset = 0
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if source is None or data.get("source") == source:
+                self.offset = data.get("offset", 0)
+
+    def save(self, offset: int):
+        """Atomically record that the first offset rows are committed."""
+        self.offset = offset
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"source": self.source, "offset": offset}, f)
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        """Remove the checkpoint once the load has completed."""
+        self.offset = 0
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+@dataclass
+class IngestStats:
+    """Counters reported by WeaviateClient.ingest_products."""
+
+    processed: int = 0
+    inserted: int = 0
+    skipped: int = 0
+    retried: int = 0
+    # {"product": <input row>, "error": <message>} per object that still failed
+    failed: List[Dict[str, Any]] = field(default_factory=list)
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    @property
+    def rate(self) -> float:
+        """Objects per second processed in this run."""
+        elapsed = self.elapsed
+        return self.processed / elapsed if elapsed > 0 else 0.0
+
+    def progress_line(self) -> str:
+        return (f"{self.skipped + self.processed} rows processed, {self.inserted} inserted, "
+                f"{len(self.failed)} failed - {self.rate:.0f} objects/sec")
+
+
+def main():
+    """Load a JSONL/CSV catalog into Weaviate."""
+    from weaviate_client import WeaviateClient
+
+    parser = argparse.ArgumentParser(description="Stream a product catalog into Weaviate.")
+    parser.add_argument("path", help="Catalog file (.jsonl, .ndjson or .csv)")
+    parser.add_argument("--batch-size", type=int, default=200, help="Objects per batch request")
+    parser.add_argument("--concurrency", type=int, default=2, help="Concurrent batch requests")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="Rows between checkpoints")
+    parser.add_argument("--max-retries", type=int, default=3, help="Retry rounds for failed objects")
+    parser.add_argument("--checkpoint", help="Checkpoint file; resumes an interrupted load")
+    parser.add_argument("--failed-output",
+                        help="Write products that still failed to this JSONL file, which can be ingested again")
+    parser.add_argument("--metrics-port", type=int, help=METRICS_PORT_HELP)
+    parser.add_argument("--app-url", help=APP_URL_HELP)
+    args = parser.parse_args()
+    serve_metrics(args.metrics_port)
+
+    checkpoint = Checkpoint(args.checkpoint, source=os.path.abspath(args.path)) if args.checkpoint else None
+
+    with WeaviateClient() as client:
+        client.initialize_schema()
+        stats = client.ingest_products(
+            read_products(args.path),
+            batch_size=args.batch_size,
+            concurrent_requests=args.concurrency,
+            chunk_size=args.chunk_size,
+            max_retries=args.max_retries,
+            checkpoint=checkpoint
+        )
+
+    if args.failed_output and stats.failed:
+        with open(args.failed_output, "w", encoding="utf-8") as f:
+            for failure in stats.failed:
+                f.write(json.dumps(failure["product"]) + "\n")
+        print(f"Wrote {len(stats.failed)} failed products to {args.failed_output} "
+              f"(last error: {stats.failed[-1]['error']})")
+
+    if checkpoint:
+        checkpoint.clear()
+
+    notify_app(args.app_url)
+
+
+if __name__ == "__main__":
+    main()
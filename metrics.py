@@ -0,0 +1,137 @@
+"""
+Hot-path instrumentation: Prometheus metrics and per-request stage timings.
+
+Code on the request path wraps each stage in ``timed("stage")``. The duration
+is recorded in the ``stage_seconds`` histogram and, while a request is being
+served, also collected for that request's ``Server-Timing`` response header
+(see ServerTimingMiddleware).
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional, Tuple
+
+from prometheus_client import Counter, Gauge, Histogram, start_http_server
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route handler",
+    ["handler", "method", "status"],
+)
+STAGE_LATENCY = Histogram(
+    "stage_duration_seconds",
+    "Time spent in each stage of request handling",
+    ["stage"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+WEAVIATE_ERRORS = Counter(
+    "weaviate_errors_total",
+    "Failed Weaviate operations",
+    ["operation"],
+)
+SEARCH_RESULTS = Histogram(
+    "search_results",
+    "Number of products returned per /products request",
+    ["kind"],
+    buckets=(0, 1, 5, 10, 20, 50, 100),
+)
+INGEST_OBJECTS = Counter(
+    "ingest_objects_total",
+    "Objects written to Weaviate by batch ingestion",
+    ["result"],
+)
+INGEST_BATCH_SECONDS = Histogram(
+    "ingest_chunk_duration_seconds",
+    "Time to embed, send and retry one ingestion chunk",
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0),
+)
+INGEST_RATE = Gauge(
+    "ingest_objects_per_second",
+    "Throughput of the most recent ingestion chunk",
+)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of values (which must be sorted)."""
+    if not values:
+        return 0.0
+    rank = max(0, min(len(values) - 1, int(round(pct / 100 * len(values) + 0.5)) - 1))
+    return values[rank]
+
+
+# Help text of the --metrics-port option shared by the ingest CLIs
+METRICS_PORT_HELP = "Serve this process's Prometheus metrics (ingest rates) on this port while it runs"
+
+
+def serve_metrics(port: Optional[int]):
+    """Expose this process's metrics over HTTP, for CLIs that run outside the app.
+
+    Ingestion runs in the ingest/generate_data/catalog_sync processes, so the
+    app's /metrics never sees their counters; Prometheus scrapes them here.
+    """
+    if port:
+        start_http_server(port)
+        print(f"Serving Prometheus metrics on :{port}/metrics")
+
+
+# Stage timings of the request currently being served, or None outside a request
+_request_timings: ContextVar[Optional[List[Tuple[str, float]]]] = ContextVar("request_timings", default=None)
+
+
+@contextmanager
+def timed(stage: str) -> Iterator[None]:
+    """Time a block as the given stage."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        STAGE_LATENCY.labels(stage=stage).observe(elapsed)
+        timings = _request_timings.get()
+        if timings is not None:
+            timings.append((stage, elapsed))
+
+
+def server_timing_header(timings: List[Tuple[str, float]], total: float) -> str:
+    """Format stage timings as a Server-Timing header value (durations in ms)."""
+    entries = [f"{stage};dur={elapsed * 1000:.2f}" for stage, elapsed in timings]
+    entries.append(f"total;dur={total * 1000:.2f}")
+    return ", ".join(entries)
+
+
+class ServerTimingMiddleware:
+    """ASGI middleware adding a Server-Timing header and recording request latency."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings: List[Tuple[str, float]] = []
+        token = _request_timings.set(timings)
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                header = server_timing_header(timings, time.perf_counter() - start)
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"server-timing", header.encode("latin-1"))
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_timings.reset(token)
+            # The router stores the matched endpoint in the scope
+            endpoint = scope.get("endpoint")
+            handler = getattr(endpoint, "__name__", type(endpoint).__name__) if endpoint else "unmatched"
+            REQUEST_LATENCY.labels(handler=handler, method=scope["method"], status=str(status)).observe(
+                time.perf_counter() - start
+            )
@@ -0,0 +1,208 @@
+"""
+In-process cache for search results with LRU/TTL eviction and single-flight
+de-duplication of concurrent misses.
+"""
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+def normalize_query(query: str) -> str:
+    """Lower-case a query and collapse whitespace so equivalent queries share a key."""
+    return " ".join(query.lower().split())
+
+
+def _freeze(value: Any) -> Hashable:
+    """Turn (possibly nested) dicts/lists into a hashable, order-independent form."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def make_key(query: str, limit: int, filters: Optional[Dict[str, Any]] = None, offset: int = 0) -> Tuple:
+    """Build a cache key from the normalized query, limit, offset and filters."""
+    return (normalize_query(query), limit, offset, _freeze(filters or {}))
+
+
+def make_facet_key(filters: Optional[Dict[str, Any]] = None, limit: int = 0) -> Tuple:
+    """Build a cache key for facet counts, distinct from any search key."""
+    return ("__facets__", limit, _freeze(filters or {}))
+
+
+class _Flight:
+    """A backend call in progress that other callers can wait on."""
+
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class QueryCache:
+    """Bounded LRU cache with per-entry TTL.
+
+    Concurrent misses for the same key are collapsed into a single backend call:
+    the first caller computes the value while the others wait for its result.
+    Exceptions raised by the backend call are propagated to every waiter and are
+    never cached.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 300.0):
+        """Create an empty cache.
+
+        Args:
+            max_size: Maximum number of entries; 0 disables caching.
+            ttl: Seconds an entry stays valid.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, _Flight] = {}
+        self._async_inflight: Dict[Hashable, asyncio.Future] = {}
+        # Bumped by clear(); results computed across a clear are not stored
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_env(cls) -> "QueryCache":
+        """Create a cache sized by QUERY_CACHE_SIZE and QUERY_CACHE_TTL."""
+        return cls(
+            max_size=int(os.getenv("QUERY_CACHE_SIZE", "1024")),
+            ttl=float(os.getenv("QUERY_CACHE_TTL", "300")),
+        )
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return (found, value) and refresh the entry's LRU position."""
+        with self._lock:
+            return self._get_locked(key)
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None):
+        """Store a value, evicting the least recently used entries when full.
+
+        With generation (read before computing the value), the value is
+        dropped if clear() ran in the meantime, since it may predate a write.
+        """
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop all cached entries (called after writes to the collection)."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and occupancy for sizing the cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "evictions": self.evictions,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for key, calling compute() once on a miss."""
+        with self._lock:
+            found, value = self._get_locked(key)
+            if found:
+                return value
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._inflight[key] = flight
+                generation = self._generation
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = compute()
+            self.set(key, flight.result, generation)
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.event.set()
+
+    async def aget_or_compute(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """Async variant of get_or_compute for use from the event loop.
+
+        The backend call runs in a task owned by the cache rather than in the
+        caller's task, so cancelling the request that started it (client
+        disconnect, timeout) neither cancels the call nor fails the callers
+        waiting on it.
+        """
+        with self._lock:
+            found, value = self._get_locked(key)
+            if found:
+                return value
+            task = self._async_inflight.get(key)
+            if task is not None:
+                self.coalesced += 1
+            generation = self._generation
+
+        if task is None:
+            task = asyncio.ensure_future(compute())
+            self._async_inflight[key] = task
+            task.add_done_callback(lambda done: self._finish_async(key, done, generation))
+        # shield() so a cancelled caller does not cancel the shared call
+        return await asyncio.shield(task)
+
+    def _finish_async(self, key: Hashable, task: "asyncio.Future", generation: int):
+        """Store the result of a finished shared call; failures are not cached."""
+        if self._async_inflight.get(key) is task:
+            del self._async_inflight[key]
+        # exception() also marks the error as retrieved when nobody awaited it
+        if not task.cancelled() and task.exception() is None:
+            self.set(key, task.result(), generation)
+
+    def _get_locked(self, key: Hashable) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, value
+            del self._entries[key]
+        self.misses += 1
+        return False, None
+
+
+# Shared by every client in the process so a write through any client
+# invalidates results served by the others.
+default_query_cache = QueryCache.from_env()
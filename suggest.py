@@ -0,0 +1,234 @@
+"""
+In-process prefix index for as-you-type suggestions.
+
+Product names, brands and categories are indexed in a sorted array of
+word-start keys ("organic whole milk", "whole milk", "milk", ...), so a prefix
+maps to a contiguous range found with bisect. Completions are ranked by
+popularity: how many products carry the term plus how often it was searched.
+Popularity only ever grows, so the top completions of each prefix are kept
+up to date incrementally as products are added and searches are recorded;
+answering a prefix never touches Weaviate. Deletions are picked up by
+rebuilding from a fresh catalog scan, which keeps the recorded searches.
+"""
+import asyncio
+import heapq
+import threading
+from bisect import bisect_left
+from typing import Any, AsyncIterable, Dict, Iterable, List
+
+from query_cache import normalize_query
+
+# Product properties offered as completions
+SUGGEST_FIELDS = ("name", "brand", "category")
+
+# Completions kept per prefix (the largest limit /suggest accepts)
+MAX_SUGGESTIONS = 10
+
+# Prefixes up to this length are ranked for every term when the index is built;
+# longer ones are ranked on first use from their (short) key range
+_PRECOMPUTED_PREFIX_LENGTH = 2
+
+# Lazily ranked prefixes kept before the memo is reset
+_MAX_MEMO_PREFIXES = 50000
+
+# Separates the indexed key from the term ID in sorted-array entries; sorts
+# before any printable character, so every key is followed by its own entries
+_SEP = "\0"
+
+
+class _Term:
+    """A suggestible value and its popularity."""
+
+    __slots__ = ("text", "kind", "products", "searches")
+
+    def __init__(self, text: str, kind: str):
+        self.text = text
+        self.kind = kind
+        self.products = 0
+        self.searches = 0
+
+    @property
+    def score(self) -> int:
+        return self.products + self.searches
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"text": self.text, "kind": self.kind, "score": self.score}
+
+
+def _term_id(kind: str, key: str) -> str:
+    return f"{kind}:{key}"
+
+
+def _word_starts(key: str) -> List[str]:
+    """The key and every suffix of it that starts at a word boundary."""
+    words = key.split(" ")
+    return [" ".join(words[i:]) for i in range(len(words))]
+
+
+def _rank_key(term: _Term):
+    return (-term.score, term.text)
+
+
+class SuggestIndex:
+    """Sorted-array prefix index with popularity-ranked completions."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._terms: Dict[str, _Term] = {}
+        self._entries: List[str] = []
+        self._top: Dict[str, List[str]] = {}
+        self._memo: Dict[str, List[str]] = {}
+        self.ready = False
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    @staticmethod
+    def _count(product: Dict[str, Any], terms: Dict[str, _Term]) -> List[str]:
+        """Add one product to the term counts; return the IDs of its terms."""
+        ids = []
+        for kind in SUGGEST_FIELDS:
+            value = product.get(kind)
+            if not value:
+                continue
+            key = normalize_query(str(value))
+            term_id = _term_id(kind, key)
+            term = terms.get(term_id)
+            if term is None:
+                term = terms[term_id] = _Term(" ".join(str(value).split()), kind)
+            term.products += 1
+            ids.append(term_id)
+        return ids
+
+    def _finalize(self, terms: Dict[str, _Term]):
+        """Build the sorted array and short-prefix rankings, then swap them in.
+
+        Search counts of terms that were already indexed carry over, so
+        periodic rebuilds do not reset popularity.
+        """
+        previous = self._terms
+        for term_id, term in terms.items():
+            if term_id in previous:
+                term.searches = previous[term_id].searches
+        entries = sorted(
+            f"{start}{_SEP}{term_id}"
+            for term_id in terms
+            for start in _word_starts(term_id.split(":", 1)[1])
+        )
+        top: Dict[str, List[str]] = {}
+        for term_id in sorted(terms, key=lambda term_id: _rank_key(terms[term_id])):
+            for prefix in self._short_prefixes(term_id):
+                ranked = top.setdefault(prefix, [])
+                if len(ranked) < MAX_SUGGESTIONS:
+                    ranked.append(term_id)
+        with self._lock:
+            self._terms = terms
+            self._entries = entries
+            self._top = top
+            self._memo = {}
+            self.ready = True
+
+    def build(self, products: Iterable[Dict[str, Any]]):
+        """Replace the index with the terms of the given products (e.g. a full catalog scan)."""
+        terms: Dict[str, _Term] = {}
+        for product in products:
+            self._count(product, terms)
+        self._finalize(terms)
+
+    async def abuild(self, products: AsyncIterable[Dict[str, Any]]):
+        """Like build, for an async stream such as AsyncWeaviateClient.iter_products().
+
+        Counting happens as products arrive; sorting runs in a worker thread so
+        the event loop keeps serving requests.
+        """
+        terms: Dict[str, _Term] = {}
+        async for product in products:
+            self._count(product, terms)
+        await asyncio.to_thread(self._finalize, terms)
+        print(f"Suggest index built with {len(terms)} terms.")
+
+    def add_products(self, products: Iterable[Dict[str, Any]]):
+        """Incrementally index newly inserted products.
+
+        Does nothing until the index has been built, so bulk loads in processes
+        that never serve suggestions do not accumulate terms.
+        """
+        with self._lock:
+            if not self.ready:
+                return
+            touched = set()
+            new_entries = []
+            for product in products:
+                for term_id in self._count(product, self._terms):
+                    if term_id not in touched and self._terms[term_id].products == 1:
+                        new_entries.extend(
+                            f"{start}{_SEP}{term_id}" for start in _word_starts(term_id.split(":", 1)[1])
+                        )
+                    touched.add(term_id)
+            if new_entries:
+                self._entries = list(heapq.merge(self._entries, sorted(new_entries)))
+            for term_id in touched:
+                self._promote(term_id)
+
+    def record_search(self, query: str):
+        """Count a search; queries equal to an indexed term raise its ranking."""
+        key = normalize_query(query)
+        with self._lock:
+            for kind in SUGGEST_FIELDS:
+                term = self._terms.get(_term_id(kind, key))
+                if term is not None:
+                    term.searches += 1
+                    self._promote(_term_id(kind, key))
+
+    def suggest(self, prefix: str, limit: int = MAX_SUGGESTIONS) -> List[Dict[str, Any]]:
+        """Most popular completions of prefix (matched at the start of any word)."""
+        prefix = normalize_query(prefix)
+        if not prefix:
+            return []
+        with self._lock:
+            ranked = self._ranked(prefix)
+            return [self._terms[term_id].to_dict() for term_id in ranked[:limit]]
+
+    def _short_prefixes(self, term_id: str) -> Iterable[str]:
+        key = term_id.split(":", 1)[1]
+        return {start[:n] for start in _word_starts(key)
+                for n in range(1, min(len(start), _PRECOMPUTED_PREFIX_LENGTH) + 1)}
+
+    def _ranked(self, prefix: str) -> List[str]:
+        """Ranked term IDs for a prefix, scanning its key range on first use."""
+        if len(prefix) <= _PRECOMPUTED_PREFIX_LENGTH:
+            return self._top.get(prefix, [])
+        ranked = self._memo.get(prefix)
+        if ranked is None:
+            start = bisect_left(self._entries, prefix)
+            end = bisect_left(self._entries, prefix + "\uffff", start)
+            candidates = {entry.split(_SEP, 1)[1] for entry in self._entries[start:end]}
+            ranked = sorted(candidates, key=lambda term_id: _rank_key(self._terms[term_id]))[:MAX_SUGGESTIONS]
+            if len(self._memo) >= _MAX_MEMO_PREFIXES:
+                self._memo = {}
+            self._memo[prefix] = ranked
+        return ranked
+
+    def _promote(self, term_id: str):
+        """Re-rank a term whose popularity grew in every ranking it belongs to."""
+        term = self._terms[term_id]
+        for start in _word_starts(term_id.split(":", 1)[1]):
+            for n in range(1, len(start) + 1):
+                prefix = start[:n]
+                rankings = self._top if n <= _PRECOMPUTED_PREFIX_LENGTH else self._memo
+                ranked = rankings.get(prefix)
+                if ranked is None:
+                    if n > _PRECOMPUTED_PREFIX_LENGTH:
+                        continue
+                    ranked = rankings[prefix] = []
+                if term_id in ranked:
+                    ranked.remove(term_id)
+                elif len(ranked) >= MAX_SUGGESTIONS and _rank_key(term) >= _rank_key(self._terms[ranked[-1]]):
+                    continue
+                ranked.append(term_id)
+                ranked.sort(key=lambda other: _rank_key(self._terms[other]))
+                del ranked[MAX_SUGGESTIONS:]
+
+
+# Process-wide index shared by the app and WeaviateClient inserts
+default_suggest_index = SuggestIndex()
@@ -0,0 +1,32 @@
+"""
+Shared fixtures: an offline WeaviateClient backed by the in-memory fake.
+"""
+import pytest
+
+from fake_weaviate import FakeWeaviate
+from generate_data import generate_products
+from query_cache import QueryCache
+from suggest import SuggestIndex
+from weaviate_client import WeaviateClient
+
+
+@pytest.fixture(autouse=True)
+def _no_local_embedder(monkeypatch):
+    """Keep tests independent of an EMBEDDER set in the developer's environment."""
+    monkeypatch.delenv("EMBEDDER", raising=False)
+
+
+@pytest.fixture
+def products():
+    return list(generate_products(200, seed=1))
+
+
+@pytest.fixture
+def fake(products):
+    return FakeWeaviate(products)
+
+
+@pytest.fixture
+def client(fake):
+    """Client with its own query cache and suggest index, so tests do not share state."""
+    return WeaviateClient(client=fake, cache=QueryCache(), suggest_index=SuggestIndex())
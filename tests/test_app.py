@@ -0,0 +1,114 @@
+import html
+import re
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app as app_module
+from fake_weaviate import FakeAsyncWeaviate
+from ingest import notify_app
+from query_cache import QueryCache
+from weaviate_client import AsyncWeaviateClient
+
+
+@pytest.fixture
+def app_client(monkeypatch, products):
+    """The app wired to the in-memory fake, with fresh caches."""
+    monkeypatch.setattr(app_module, "weaviate_client",
+                        AsyncWeaviateClient(client=FakeAsyncWeaviate(products), cache=QueryCache()))
+    monkeypatch.setattr(app_module, "page_cache", QueryCache())
+    with TestClient(app_module.app) as client:
+        yield client
+
+
+def test_catalog_changed_requires_admin_token(app_client, monkeypatch):
+    monkeypatch.setattr(app_module, "ADMIN_TOKEN", None)
+    assert app_client.post("/catalog/changed").status_code == 403
+
+    monkeypatch.setattr(app_module, "ADMIN_TOKEN", "secret")
+    assert app_client.post("/catalog/changed").status_code == 401
+    assert app_client.post("/catalog/changed", headers={"Authorization": "Bearer wrong"}).status_code == 401
+
+
+def test_catalog_changed_clears_caches(app_client, monkeypatch):
+    monkeypatch.setattr(app_module, "ADMIN_TOKEN", "secret")
+    assert app_client.get("/products", params={"q": "milk"}).status_code == 200
+    assert app_module.weaviate_client.cache.stats()["size"] > 0
+    assert app_module.page_cache.stats()["size"] > 0
+
+    response = app_client.post("/catalog/changed", headers={"Authorization": "Bearer secret"})
+
+    assert response.status_code == 200
+    assert app_module.weaviate_client.cache.stats()["size"] == 0
+    assert app_module.page_cache.stats()["size"] == 0
+
+
+def test_notify_app_without_url_is_a_no_op(monkeypatch):
+    monkeypatch.delenv("APP_URL", raising=False)
+    assert notify_app() is False
+
+
+def _wait_for_suggestion(client, prefix, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        suggestions = client.get("/suggest", params={"q": prefix}).json()["suggestions"]
+        if suggestions:
+            return suggestions
+        time.sleep(0.01)
+    return []
+
+
+def test_suggest_index_is_built_and_refreshed_on_catalog_change(app_client, monkeypatch):
+    monkeypatch.setattr(app_module, "ADMIN_TOKEN", "secret")
+    assert _wait_for_suggestion(app_client, "o")
+
+    # Written by another process: only the fake's store changes
+    app_module.weaviate_client.client.stores["Product"].put({"name": "Quokka Crisps", "brand": "Outback"})
+    assert app_client.get("/suggest", params={"q": "quokka"}).json()["suggestions"] == []
+
+    app_client.post("/catalog/changed", headers={"Authorization": "Bearer secret"})
+    assert [s["text"] for s in _wait_for_suggestion(app_client, "quokka")] == ["Quokka Crisps"]
+
+
+def test_searches_are_recorded_once(app_client, monkeypatch):
+    recorded = []
+    monkeypatch.setattr(app_module.default_suggest_index, "record_search", recorded.append)
+
+    first = app_client.get("/products", params={"q": "milk"})
+    app_client.get("/products", params={"q": "milk", "offset": 20})
+    app_client.get("/products", params={"q": "milk"}, headers={"If-None-Match": first.headers["ETag"]})
+    assert recorded == ["milk"]
+
+
+def test_batch_search(app_client):
+    response = app_client.post("/api/search/batch", json={"queries": [
+        {"q": "milk", "limit": 5},
+        {"q": "bread", "filters": {"max_price": 10}},
+    ]})
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["q"] for result in results] == ["milk", "bread"]
+    assert all(result["status"] == "ok" for result in results)
+    assert len(results[0]["products"]) == 5
+
+
+@pytest.mark.parametrize("query", [
+    {"q": "milk", "limt": 5},
+    {"q": "milk", "filters": {"colour": "red"}},
+])
+def test_batch_search_rejects_unknown_fields(app_client, query):
+    assert app_client.post("/api/search/batch", json={"queries": [query]}).status_code == 422
+
+
+def test_cursor_pagination(app_client):
+    first = app_client.get("/products", params={"limit": 5})
+    next_url = html.unescape(re.search(r'href="(/products\?[^"]*after=[^"]*)"', first.text).group(1))
+    assert app_client.get(next_url).status_code == 200
+
+
+@pytest.mark.parametrize("after", ["not-a-uuid", "1234"])
+def test_invalid_cursor_is_rejected(app_client, after):
+    response = app_client.get("/products", params={"after": after})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "after must be a valid cursor"
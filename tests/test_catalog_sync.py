@@ -0,0 +1,97 @@
+import uuid
+
+import pytest
+
+from catalog_sync import CONTENT_HASH_PROPERTY, content_hash, product_key, product_uuid
+from generate_data import generate_products
+
+CATALOG = [
+    {"sku": "A-1", "name": "Whole Milk", "brand": "Dairy Farm", "category": "Dairy", "price": 3.49},
+    {"sku": "A-2", "name": "Sourdough", "brand": "Bakehouse", "category": "Bakery", "price": 4.99},
+    {"name": "Bananas", "brand": "Tropical Fresh", "category": "Fruits", "price": 2.49},
+]
+
+
+@pytest.fixture
+def products():
+    """Start from an empty collection; tests write CATALOG into it."""
+    return []
+
+
+def _stored(fake):
+    return {str(obj.uuid): obj.properties for obj in fake.stores["Product"].objects}
+
+
+def test_product_key_prefers_sku():
+    assert product_key({"sku": "A-1", "name": "x"}) == "sku:A-1"
+    assert product_key({"name": " Whole  Milk", "brand": "Dairy FARM"}) == "whole milk|dairy farm"
+    assert product_uuid({"name": "Whole Milk", "brand": "Dairy Farm"}) == product_uuid({"name": "whole milk", "brand": "dairy farm"})
+
+
+def test_content_hash_ignores_unstored_fields():
+    product = dict(CATALOG[0])
+    assert content_hash(product) == content_hash({**product, "sku": "other"})
+    assert content_hash(product) != content_hash({**product, "price": 3.59})
+
+
+def test_generated_products_have_distinct_ids():
+    products = list(generate_products(5000, seed=3))
+    assert len({product_uuid(product) for product in products}) == len(products)
+
+
+def test_insert_is_idempotent(client, fake):
+    client.insert_products(CATALOG)
+    client.insert_products(CATALOG)
+    stored = _stored(fake)
+    assert set(stored) == {product_uuid(product) for product in CATALOG}
+    assert all("sku" not in properties for properties in stored.values())
+    assert stored[product_uuid(CATALOG[0])][CONTENT_HASH_PROPERTY] == content_hash(CATALOG[0])
+
+
+def test_sync_creates_then_skips_unchanged(client, fake):
+    stats = client.sync_products(CATALOG, progress=False)
+    assert (stats.created, stats.updated, stats.unchanged, stats.deleted) == (3, 0, 0, 0)
+
+    stats = client.sync_products(CATALOG, progress=False)
+    assert (stats.created, stats.updated, stats.unchanged, stats.deleted) == (0, 0, 3, 0)
+    assert len(_stored(fake)) == 3
+
+
+def test_sync_updates_changed_and_deletes_missing(client, fake):
+    client.sync_products(CATALOG, progress=False)
+    changed = {**CATALOG[0], "price": 3.79}
+    added = {"sku": "A-3", "name": "Bagels", "brand": "Bakehouse", "category": "Bakery", "price": 3.99}
+
+    stats = client.sync_products([changed, CATALOG[1], added], progress=False)
+
+    assert (stats.created, stats.updated, stats.unchanged, stats.deleted) == (1, 1, 1, 1)
+    stored = _stored(fake)
+    assert set(stored) == {product_uuid(p) for p in (changed, CATALOG[1], added)}
+    assert stored[product_uuid(changed)]["price"] == 3.79
+
+
+def test_sync_keep_missing(client, fake):
+    client.sync_products(CATALOG, progress=False)
+    stats = client.sync_products(CATALOG[:1], delete_missing=False, progress=False)
+    assert stats.deleted == 0
+    assert len(_stored(fake)) == 3
+
+
+def test_sync_removes_legacy_duplicates(client, fake):
+    # Objects written before deterministic IDs had random UUIDs and no hash
+    store = fake.stores["Product"]
+    for product in CATALOG:
+        store.put(dict(product), object_uuid=uuid.uuid4())
+
+    stats = client.sync_products(CATALOG, progress=False)
+
+    assert stats.created == 3
+    assert stats.deleted == 3
+    assert set(_stored(fake)) == {product_uuid(product) for product in CATALOG}
+
+
+def test_sync_clears_search_cache(client):
+    client.sync_products(CATALOG, progress=False)
+    client.search_products("milk")
+    client.sync_products(CATALOG[:2], progress=False)
+    assert client.cache.stats()["size"] == 0
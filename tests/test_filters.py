@@ -0,0 +1,98 @@
+import pytest
+
+from weaviate_client import _build_filters
+
+CATALOG = [
+    {"name": "Whole Milk", "brand": "Dairy Farm", "category": "Dairy", "price": 3.49},
+    {"name": "Skim Milk", "brand": "Dairy Farm", "category": "Dairy", "price": 2.99},
+    {"name": "Greek Yogurt", "brand": "Olympus", "category": "Dairy", "price": 5.49},
+    {"name": "Sourdough", "brand": "Bakehouse", "category": "Bakery", "price": 4.99},
+    {"name": "Bagels", "brand": "Bakehouse", "category": "Bakery", "price": 3.99},
+]
+
+
+@pytest.fixture
+def products():
+    return CATALOG
+
+
+def _names(products):
+    return sorted(product.name for product in products)
+
+
+def test_empty_filters_build_no_filter():
+    assert _build_filters(None) is None
+    assert _build_filters({}) is None
+    assert _build_filters({"category": ""}) is None
+
+
+def test_single_condition():
+    condition = _build_filters({"category": "Dairy"})
+    assert condition.target == "category"
+    assert condition.operator.name == "EQUAL"
+    assert condition.value == "Dairy"
+
+
+def test_conditions_are_combined_with_and():
+    combined = _build_filters({"brand": "Bakehouse", "min_price": 1, "max_price": 4.5})
+    assert type(combined).__name__ == "_FilterAnd"
+    assert [(f.target, f.operator.name, f.value) for f in combined.filters] == [
+        ("brand", "EQUAL", "Bakehouse"),
+        ("price", "GREATER_THAN_EQUAL", 1),
+        ("price", "LESS_THAN_EQUAL", 4.5),
+    ]
+
+
+def test_zero_price_bound_is_kept():
+    assert _build_filters({"min_price": 0}).value == 0
+
+
+def test_unknown_filter_is_rejected():
+    with pytest.raises(ValueError, match="colour"):
+        _build_filters({"colour": "red"})
+
+
+def test_filtered_listing(client):
+    assert _names(client.get_all_products(filters={"category": "Dairy"})) == ["Greek Yogurt", "Skim Milk", "Whole Milk"]
+    assert _names(client.get_all_products(filters={"category": "Dairy", "max_price": 3.5})) == ["Skim Milk", "Whole Milk"]
+    assert _names(client.get_all_products(filters={"min_price": 4, "max_price": 5})) == ["Sourdough"]
+
+
+def test_filtered_search(client):
+    results = client.search_products("bread", filters={"brand": "Bakehouse"})
+    assert _names(results) == ["Bagels", "Sourdough"]
+
+
+def test_facets(client):
+    facets = client.get_facets()
+    assert facets["total"] == 5
+    assert facets["category"] == [("Dairy", 3), ("Bakery", 2)]
+    assert dict(facets["brand"]) == {"Dairy Farm": 2, "Olympus": 1, "Bakehouse": 2}
+
+
+def test_facets_respect_filters(client):
+    facets = client.get_facets({"category": "Dairy"})
+    assert facets["total"] == 3
+    assert dict(facets["brand"]) == {"Dairy Farm": 2, "Olympus": 1}
+    assert facets["category"] == [("Dairy", 3), ("Bakery", 2)]
+
+
+def test_facets_ignore_their_own_filter(client):
+    facets = client.get_facets({"category": "Dairy", "brand": "Dairy Farm"})
+    assert facets["total"] == 2
+    assert facets["category"] == [("Dairy", 2)]
+    assert dict(facets["brand"]) == {"Dairy Farm": 2, "Olympus": 1}
+
+    facets = client.get_facets({"brand": "Bakehouse", "max_price": 4})
+    assert facets["total"] == 1
+    assert facets["category"] == [("Bakery", 1)]
+    assert dict(facets["brand"]) == {"Dairy Farm": 2, "Bakehouse": 1}
+
+
+def test_unknown_filter_reaches_the_caller(client):
+    for call in (lambda: client.search_products("milk", filters={"colour": "red"}),
+                 lambda: client.get_all_products(filters={"colour": "red"}),
+                 lambda: client.get_facets({"colour": "red"})):
+        with pytest.raises(ValueError, match="colour"):
+            call()
+    assert client.cache.stats()["misses"] == 0
@@ -0,0 +1,57 @@
+import pytest
+
+from generate_data import generate_products
+from ingest import Checkpoint
+
+CATALOG = list(generate_products(120, seed=3))
+
+
+@pytest.fixture
+def products():
+    """Start from an empty collection; tests ingest CATALOG into it."""
+    return []
+
+
+def _interrupted(rows, after):
+    """Yield the first `after` rows, then fail like a broken input stream."""
+    for i, row in enumerate(rows):
+        if i == after:
+            raise OSError("input stream broke")
+        yield row
+
+
+def test_failed_objects_are_retried(client, fake):
+    fake.stores["Product"].write_failures = 2
+    stats = client.ingest_products(CATALOG, chunk_size=50, retry_backoff=0, progress=False)
+    assert stats.inserted == len(CATALOG)
+    assert stats.retried == 2 * len(CATALOG)
+    assert stats.failed == []
+    assert len(fake.stores["Product"].objects) == len(CATALOG)
+
+
+def test_gives_up_after_max_retries(client, fake):
+    fake.stores["Product"].write_failures = 3
+    stats = client.ingest_products(CATALOG, chunk_size=50, max_retries=2, retry_backoff=0, progress=False)
+    assert stats.processed == len(CATALOG)
+    assert stats.inserted == 0
+    assert [failure["product"] for failure in stats.failed] == CATALOG
+    assert stats.failed[0]["error"] == "simulated batch failure"
+    assert fake.stores["Product"].objects == []
+
+
+def test_resumes_from_checkpoint(client, fake, tmp_path):
+    path = str(tmp_path / "catalog.ckpt")
+    with pytest.raises(OSError):
+        client.ingest_products(_interrupted(CATALOG, 70), chunk_size=50, checkpoint=Checkpoint(path, "catalog"),
+                               progress=False)
+    # Only the first full chunk was committed
+    assert Checkpoint(path, "catalog").offset == 50
+    fake.stores["Product"].write_failures = 1
+
+    stats = client.ingest_products(CATALOG, chunk_size=50, retry_backoff=0, checkpoint=Checkpoint(path, "catalog"),
+                                   progress=False)
+    assert stats.skipped == 50
+    assert stats.processed == len(CATALOG) - 50
+    assert stats.retried == len(CATALOG) - 50
+    assert Checkpoint(path, "catalog").offset == len(CATALOG)
+    assert len(fake.stores["Product"].objects) == len(CATALOG)
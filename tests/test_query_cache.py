@@ -0,0 +1,229 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+import query_cache
+from query_cache import QueryCache, make_key
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def test_make_key_normalizes_query():
+    assert make_key("  Whole   MILK ", 10) == make_key("whole milk", 10)
+    assert make_key("milk", 10, {"brand": "a", "category": "b"}) == make_key("milk", 10, {"category": "b", "brand": "a"})
+    assert make_key("milk", 10) != make_key("milk", 20)
+    assert make_key("milk", 10, offset=10) != make_key("milk", 10)
+
+
+def test_lru_eviction():
+    cache = QueryCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == (True, 1)  # "b" is now least recently used
+    cache.set("c", 3)
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, 1)
+    assert cache.get("c") == (True, 3)
+    assert cache.stats()["evictions"] == 1
+
+
+def test_zero_size_disables_caching():
+    cache = QueryCache(max_size=0)
+    cache.set("a", 1)
+    assert cache.get("a") == (False, None)
+
+
+def test_ttl_expiry(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(query_cache.time, "monotonic", lambda: now[0])
+    cache = QueryCache(ttl=10)
+    cache.set("a", 1)
+    now[0] += 9
+    assert cache.get("a") == (True, 1)
+    now[0] += 2
+    assert cache.get("a") == (False, None)
+    assert cache.stats()["size"] == 0
+
+
+def test_get_or_compute_caches_result():
+    cache = QueryCache()
+    calls = []
+    assert cache.get_or_compute("k", lambda: calls.append(1) or "v") == "v"
+    assert cache.get_or_compute("k", lambda: calls.append(1) or "other") == "v"
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1
+
+
+def _run_concurrently(cache, compute, callers):
+    """Call get_or_compute from callers threads; return their results/exceptions."""
+    results = [None] * callers
+
+    def call(i):
+        try:
+            results[i] = cache.get_or_compute("k", compute)
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(callers)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def test_concurrent_misses_are_coalesced():
+    cache = QueryCache()
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        release.wait(5)
+        return "v"
+
+    threads, results = _run_concurrently(cache, compute, 8)
+    # Release the leader only once every other caller is waiting on it
+    _wait_for(lambda: cache.stats()["coalesced"] == 7)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == ["v"] * 8
+
+
+def test_errors_propagate_to_followers_and_are_not_cached():
+    cache = QueryCache()
+    release = threading.Event()
+
+    def compute():
+        release.wait(5)
+        raise RuntimeError("backend down")
+
+    threads, results = _run_concurrently(cache, compute, 4)
+    _wait_for(lambda: cache.stats()["coalesced"] == 3)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert cache.stats()["size"] == 0
+    assert cache.get_or_compute("k", lambda: "recovered") == "recovered"
+
+
+def test_async_concurrent_misses_are_coalesced():
+    cache = QueryCache()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "v"
+
+    async def main():
+        return await asyncio.gather(*(cache.aget_or_compute("k", compute) for _ in range(8)))
+
+    assert asyncio.run(main()) == ["v"] * 8
+    assert len(calls) == 1
+    assert cache.stats()["coalesced"] == 7
+
+
+def test_async_errors_propagate_to_followers():
+    cache = QueryCache()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise RuntimeError("backend down")
+
+    async def main():
+        return await asyncio.gather(
+            *(cache.aget_or_compute("k", compute) for _ in range(4)), return_exceptions=True
+        )
+
+    results = asyncio.run(main())
+    assert len(calls) == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert cache.stats()["size"] == 0
+
+
+def test_insert_clears_search_cache(client):
+    first = client.search_products("milk", limit=5)
+    assert first
+    assert client.search_products("milk", limit=5) is first
+    assert client.cache.stats()["size"] > 0
+
+    client.insert_products([{"name": "Oat Milk", "brand": "Oatly", "category": "Dairy", "price": 2.99}])
+
+    assert client.cache.stats()["size"] == 0
+    misses = client.cache.stats()["misses"]
+    client.search_products("milk", limit=5)
+    assert client.cache.stats()["misses"] == misses + 1
+
+
+def test_search_errors_are_not_cached(client, monkeypatch):
+    def failing(*args, **kwargs):
+        raise RuntimeError("backend down")
+
+    monkeypatch.setattr(client, "_search_products", failing)
+    assert client.search_products("milk") == []
+    assert client.cache.stats()["size"] == 0
+    monkeypatch.delattr(client, "_search_products")
+    assert client.search_products("milk")
+
+
+def test_async_cancelled_leader_does_not_fail_followers():
+    cache = QueryCache()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return "v"
+
+    async def main():
+        leader = asyncio.create_task(cache.aget_or_compute("k", compute))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(cache.aget_or_compute("k", compute))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(main()) == "v"
+    assert len(calls) == 1
+    assert cache.get("k") == (True, "v")
+
+
+def test_clear_during_compute_drops_stale_result():
+    cache = QueryCache()
+
+    def compute():
+        cache.clear()  # e.g. insert_products finished while the query was running
+        return "stale"
+
+    assert cache.get_or_compute("k", compute) == "stale"
+    assert cache.get("k") == (False, None)
+
+
+def test_async_clear_during_compute_drops_stale_result():
+    cache = QueryCache()
+
+    async def compute():
+        await asyncio.sleep(0)
+        cache.clear()
+        return "stale"
+
+    async def main():
+        return await cache.aget_or_compute("k", compute)
+
+    assert asyncio.run(main()) == "stale"
+    assert cache.get("k") == (False, None)
@@ -0,0 +1,114 @@
+import pytest
+
+from suggest import MAX_SUGGESTIONS, SuggestIndex
+
+
+def _texts(suggestions):
+    return [suggestion["text"] for suggestion in suggestions]
+
+
+def _expected(index, prefix, limit=MAX_SUGGESTIONS):
+    """Brute-force ranking: every term with a word starting with prefix, by score then text."""
+    matches = []
+    for term_id, term in index._terms.items():
+        words = term_id.split(":", 1)[1].split(" ")
+        if any(" ".join(words[i:]).startswith(prefix) for i in range(len(words))):
+            matches.append(term)
+    return [term.text for term in sorted(matches, key=lambda term: (-term.score, term.text))[:limit]]
+
+
+@pytest.fixture
+def index(products):
+    index = SuggestIndex()
+    index.build(products)
+    return index
+
+
+def test_matches_the_start_of_any_word():
+    index = SuggestIndex()
+    index.build([
+        {"name": "Organic Whole Milk", "brand": "Dairy Farm", "category": "Dairy"},
+        {"name": "Milk Chocolate", "brand": "Cocoa Co", "category": "Snacks"},
+    ])
+    assert set(_texts(index.suggest("mil"))) == {"Organic Whole Milk", "Milk Chocolate"}
+    assert _texts(index.suggest("whole m")) == ["Organic Whole Milk"]
+    assert _texts(index.suggest("ilk")) == []
+    assert index.suggest("   ") == []
+
+
+def test_ranked_by_product_count():
+    index = SuggestIndex()
+    index.build(
+        [{"name": "Bagels", "brand": "Bakehouse", "category": "Bakery"}] * 3
+        + [{"name": "Baguette", "brand": "Bakehouse", "category": "Bakery"}]
+    )
+    suggestions = index.suggest("ba")
+    assert _texts(suggestions)[:2] == ["Bakehouse", "Bakery"]
+    assert suggestions[0] == {"text": "Bakehouse", "kind": "brand", "score": 4}
+    assert _texts(index.suggest("bag")) == ["Bagels", "Baguette"]
+
+
+@pytest.mark.parametrize("prefix", ["o", "or", "org", "whole", "ch", "cheese", "frozen v"])
+def test_matches_brute_force(index, prefix):
+    assert _texts(index.suggest(prefix)) == _expected(index, prefix)
+
+
+def test_limit(index):
+    assert len(index.suggest("s", limit=3)) == 3
+
+
+def test_searches_promote_terms(index):
+    for prefix in ("o", "org", "organic"):
+        index.suggest(prefix)  # populate memoized rankings before the searches
+    last = _texts(index.suggest("org"))[-1]
+    for _ in range(1000):
+        index.record_search(last.upper())
+
+    for prefix in ("o", "or", "org", "organic"):
+        assert _texts(index.suggest(prefix)) == _expected(index, prefix)
+        assert _texts(index.suggest(prefix))[0] == last
+
+
+def test_unknown_searches_are_ignored(index):
+    before = len(index)
+    index.record_search("something nobody sells")
+    assert len(index) == before
+    assert index.suggest("something nobody") == []
+
+
+def test_add_products_is_incremental(index):
+    index.suggest("zy")
+    index.suggest("zyzzyva")
+    index.add_products([{"name": "Zyzzyva Crunch Bar", "brand": "Zorro", "category": "Snacks"}] * 2)
+
+    assert index.suggest("zyzzyva") == [{"text": "Zyzzyva Crunch Bar", "kind": "name", "score": 2}]
+    assert _texts(index.suggest("crunch b")) == ["Zyzzyva Crunch Bar"]
+    for prefix in ("z", "zo", "s", "sn", "snacks"):
+        assert _texts(index.suggest(prefix)) == _expected(index, prefix)
+
+
+def test_add_products_before_build_is_ignored():
+    index = SuggestIndex()
+    index.add_products([{"name": "Bagels"}])
+    assert not index.ready
+    assert len(index) == 0
+
+
+def test_insert_products_refreshes_index(client, products):
+    client.suggest_index.build(products)
+    client.insert_products([{"name": "Quokka Crisps", "brand": "Outback", "category": "Snacks", "price": 1.99}])
+    assert _texts(client.suggest_index.suggest("quokka")) == ["Quokka Crisps"]
+
+
+def test_rebuild_drops_removed_products_and_keeps_searches():
+    index = SuggestIndex()
+    index.build([{"name": "Bagels"}, {"name": "Baguette"}])
+    index.record_search("baguette")
+    index.build([{"name": "Baguette"}])
+    assert index.suggest("bag") == [{"text": "Baguette", "kind": "name", "score": 2}]
+
+
+def test_iter_products_projects_properties(client):
+    rows = list(client.iter_products(batch_size=50, return_properties=["name", "brand", "category"]))
+    assert len(rows) == 200
+    assert all(set(row) <= {"name", "brand", "category"} for row in rows)
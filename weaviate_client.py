@@ -2,48 +2,241 @@
 Weaviate client for managing product schema and semantic search.
 Uses Weaviate Python Client v4 API.
 """
+import asyncio
+import logging
 import os
+import time
+from itertools import islice
 import weaviate
-from weaviate.classes.config import Configure, Property, DataType
-from typing import List, Dict, Any, Optional
+from weaviate.classes.config import Configure, Property, DataType, Tokenization
+from weaviate.classes.query import Filter, MetadataQuery, Metrics
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator, AsyncIterator, Union
 from dotenv import load_dotenv
+from query_cache import QueryCache, default_query_cache, make_facet_key, make_key
+from ingest import Checkpoint, IngestStats
+from catalog_sync import CONTENT_HASH_PROPERTY, SyncStats, content_hash, product_uuid, with_content_hash
+from embeddings import Embedder, embedder_from_env
+from index_config import VectorIndexSettings
+from suggest import SuggestIndex, default_suggest_index
+from metrics import (
+    INGEST_BATCH_SECONDS, INGEST_OBJECTS, INGEST_RATE, WEAVIATE_ERRORS, timed
+)
+
+logger = logging.getLogger(__name__)
+
+# Products embedded per NumPy call when vectors are computed client-side
+EMBED_BATCH_SIZE = 1024
+
+# Object IDs per delete_many call when sync_products removes products
+SYNC_DELETE_BATCH_SIZE = 1000
+
+# Keys accepted in the ``filters`` dict of search/fetch methods
+FILTER_FIELDS = ("category", "brand", "min_price", "max_price")
+
+# Properties returned as facet counts by get_facets
+FACET_FIELDS = ("category", "brand")
+
 
 # Load environment variables from .env file
 load_dotenv()
 
 
+# Properties requested from Weaviate for result pages (what the templates render)
+PRODUCT_PROPERTIES = ("name", "description", "price", "category", "brand", "image_url")
+
+
+class Product:
+    """Compact search result: the displayed properties plus the relevance score.
+    
+    Uses __slots__ instead of a per-object dict; instances held in the query
+    cache are shared between requests and must not be mutated.
+    """
+    
+    __slots__ = PRODUCT_PROPERTIES + ("score",)
+    
+    def __init__(self, name: str = "", description: str = "", price: float = 0.0, category: str = "",
+                 brand: str = "", image_url: str = "", score: Optional[float] = None):
+        self.name = name
+        self.description = description
+        self.price = price
+        self.category = category
+        self.brand = brand
+        self.image_url = image_url
+        self.score = score
+    
+    @classmethod
+    def from_object(cls, obj) -> "Product":
+        """Build a Product from a v4 query result object."""
+        properties = obj.properties
+        return cls(
+            name=properties.get("name", ""),
+            description=properties.get("description", ""),
+            price=properties.get("price") or 0.0,
+            category=properties.get("category", ""),
+            brand=properties.get("brand", ""),
+            image_url=properties.get("image_url", ""),
+            score=getattr(obj.metadata, "score", None)
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict, e.g. for JSON responses."""
+        return {name: getattr(self, name) for name in self.__slots__}
+    
+    def __repr__(self) -> str:
+        return "Product(" + ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__) + ")"
+
+
+def _get_headers() -> Dict[str, str]:
+    """Build the request headers passed to Weaviate (vectorizer API keys)."""
+    headers = {}
+    if os.getenv("COHERE_APIKEY"):
+        headers["X-Cohere-Api-Key"] = os.getenv("COHERE_APIKEY")
+    return headers
+
+
+def _parse_url(url: Optional[str]) -> Tuple[bool, str, int]:
+    """Split a Weaviate URL into connection parameters.
+    
+    Args:
+        url: Weaviate URL. If not provided, uses WEAVIATE_URL from .env or defaults to http://localhost:8080
+    
+    Returns:
+        Tuple of (is_local, host, port).
+    """
+    if url is None:
+        url = os.getenv("WEAVIATE_URL", "http://localhost:8080")
+    
+    # For local connections, use connect_to_local
+    if url.startswith("http://localhost") or url.startswith("http://127.0.0.1"):
+        return True, "localhost", 8080
+    
+    # Parse URL for custom connection
+    if url.startswith("http://"):
+        url = url[7:]
+    elif url.startswith("https://"):
+        url = url[8:]
+    
+    # Split host and port
+    if ":" in url:
+        host, port = url.split(":", 1)
+        port = int(port)
+    else:
+        host = url
+        port = 8080
+    
+    return False, host, port
+
+
+def _to_page(objects, limit: int) -> Tuple[List[Product], Optional[str]]:
+    """Convert fetched objects to (products, next_cursor) for cursor pagination."""
+    products = [Product.from_object(obj) for obj in objects]
+    next_cursor = str(objects[-1].uuid) if len(objects) == limit else None
+    return products, next_cursor
+
+
+def _query_vector(embedder: Optional[Embedder], query: str):
+    """Embed a search query locally, or None to let Weaviate vectorize it."""
+    if embedder is None:
+        return None
+    return embedder.embed([query])[0].tolist()
+
+
+def _check_filters(filters: Optional[Dict[str, Any]]):
+    """Raise ValueError for keys of a filters dict that are not in FILTER_FIELDS.
+    
+    Called before the cache and error handling of the query methods, so a bad
+    filter reaches the caller instead of being logged as a Weaviate error.
+    """
+    unknown = set(filters or ()) - set(FILTER_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown filter(s): {', '.join(sorted(unknown))}")
+
+
+def _build_filters(filters: Optional[Dict[str, Any]]):
+    """Translate a filters dict (see FILTER_FIELDS) into a Weaviate filter, or None."""
+    if not filters:
+        return None
+    _check_filters(filters)
+    
+    conditions = []
+    if filters.get("category"):
+        conditions.append(Filter.by_property("category").equal(filters["category"]))
+    if filters.get("brand"):
+        conditions.append(Filter.by_property("brand").equal(filters["brand"]))
+    if filters.get("min_price") is not None:
+        conditions.append(Filter.by_property("price").greater_or_equal(filters["min_price"]))
+    if filters.get("max_price") is not None:
+        conditions.append(Filter.by_property("price").less_or_equal(filters["max_price"]))
+    
+    if not conditions:
+        return None
+    if len(conditions) == 1:
+        return conditions[0]
+    return Filter.all_of(conditions)
+
+
+def _facet_queries(filters: Optional[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], Tuple[str, ...]]]:
+    """(filters, facet fields) of each aggregate query get_facets runs.
+    
+    Facets are disjunctive: each one is counted with every filter except its
+    own, so choosing a category still lists the other categories with their
+    counts. The first query applies all filters and also returns the total;
+    every facet that is filtered on needs one more query.
+    """
+    filters = filters or {}
+    selected = [name for name in FACET_FIELDS if filters.get(name)]
+    queries = [(filters, tuple(name for name in FACET_FIELDS if name not in selected))]
+    for name in selected:
+        queries.append(({key: value for key, value in filters.items() if key != name}, (name,)))
+    return queries
+
+
+def _facet_metrics(fields: Tuple[str, ...], limit: int):
+    """Top-occurrence metrics for the given facet properties, for one aggregate query."""
+    return [
+        Metrics(name).text(top_occurrences_count=True, top_occurrences_value=True, limit=limit)
+        for name in fields
+    ] or None
+
+
+def _to_facets(responses, queries) -> Dict[str, Any]:
+    """Merge the aggregate responses of _facet_queries into {"total": n, "<field>": [(value, count), ...]}."""
+    facets = {"total": responses[0].total_count}
+    for response, (_, fields) in zip(responses, queries):
+        for name in fields:
+            facets[name] = [
+                (occurrence.value, occurrence.count)
+                for occurrence in response.properties[name].top_occurrences
+            ]
+    return facets
+
+
 class WeaviateClient:
-    def __init__(self, url: str = None):
+    def __init__(self, url: str = None, cache: Optional[QueryCache] = None, client=None,
+                 embedder: Optional[Embedder] = None, index_settings: Optional[VectorIndexSettings] = None,
+                 suggest_index: Optional[SuggestIndex] = None):
         """Initialize Weaviate client connection.
         
         Args:
             url: Weaviate URL. If not provided, uses WEAVIATE_URL from .env or defaults to http://localhost:8080
+            cache: Search result cache. Defaults to the process-wide shared cache.
+            client: Pre-built v4 client to use instead of connecting to url
+                (e.g. the in-memory fake from fake_weaviate.py).
+            embedder: Local embedder for bring-your-own-vectors mode. Defaults to
+                the one named by EMBEDDER; if none, Weaviate vectorizes with Cohere.
+            index_settings: HNSW/compression settings used by initialize_schema.
+                Defaults to VectorIndexSettings.from_env().
+            suggest_index: Typeahead index refreshed after inserts. Defaults to the
+                process-wide shared index.
         """
-        headers = {
-            "X-Cohere-Api-Key": os.getenv("COHERE_APIKEY")
-            }
-        
-        if url is None:
-            url = os.getenv("WEAVIATE_URL", "http://localhost:8080")
+        headers = _get_headers()
+        is_local, host, port = _parse_url(url)
         
-        # For local connections, use connect_to_local
-        if url.startswith("http://localhost") or url.startswith("http://127.0.0.1"):
+        if client is not None:
+            self.client = client
+        elif is_local:
             self.client = weaviate.connect_to_local(headers=headers)
         else:
-            # Parse URL for custom connection
-            if url.startswith("http://"):
-                url = url[7:]
-            elif url.startswith("https://"):
-                url = url[8:]
-            
-            # Split host and port
-            if ":" in url:
-                host, port = url.split(":", 1)
-                port = int(port)
-            else:
-                host = url
-                port = 8080
-            
             # Connect using v4 API for custom URL
             self.client = weaviate.connect_to_custom(
                 http_host=host,
@@ -55,6 +248,10 @@ class WeaviateClient:
             )
         
         self.collection_name = "Product"
+        self.cache = cache if cache is not None else default_query_cache
+        self.embedder = embedder if embedder is not None else embedder_from_env()
+        self.index_settings = index_settings if index_settings is not None else VectorIndexSettings.from_env()
+        self.suggest_index = suggest_index if suggest_index is not None else default_suggest_index
     
     def __enter__(self):
         """Context manager entry."""
@@ -74,6 +271,8 @@ class WeaviateClient:
         
         Uses Cohere vectorizer (text2vec-cohere). The COHERE_API_KEY must be configured
         in your Weaviate instance environment variables (typically in Docker).
+        With a local embedder the collection has no vectorizer and vectors are
+        supplied by this client instead.
         """
         # Check if collection already exists
         if self.client.collections.exists(self.collection_name):
@@ -92,15 +291,42 @@ class WeaviateClient:
                         data_type=DataType.TEXT, 
                         description="Product description for semantic search"
                     ),
-                    Property(name="price", data_type=DataType.NUMBER, description="Product price"),
-                    Property(name="category", data_type=DataType.TEXT, description="Product category"),
-                    Property(name="brand", data_type=DataType.TEXT, description="Product brand"),
+                    Property(
+                        name="price",
+                        data_type=DataType.NUMBER,
+                        description="Product price",
+                        index_filterable=True,
+                        index_range_filters=True
+                    ),
+                    # Whole-value tokenization so filters and facets match exact names
+                    Property(
+                        name="category",
+                        data_type=DataType.TEXT,
+                        description="Product category",
+                        tokenization=Tokenization.FIELD,
+                        index_filterable=True
+                    ),
+                    Property(
+                        name="brand",
+                        data_type=DataType.TEXT,
+                        description="Product brand",
+                        tokenization=Tokenization.FIELD,
+                        index_filterable=True
+                    ),
                     Property(name="image_url", data_type=DataType.TEXT, description="Product image URL"),
+                    # Change detection for sync_products; never vectorized or searched
+                    Property(
+                        name=CONTENT_HASH_PROPERTY,
+                        data_type=DataType.TEXT,
+                        description="Hash of the product content",
+                        skip_vectorization=True,
+                        vectorize_property_name=False,
+                        index_searchable=False,
+                        index_filterable=False
+                    ),
                 ],
-                vectorizer_config=Configure.Vectorizer.text2vec_cohere(
-                    model="embed-english-v3.0",
-                    truncate="NONE"
-                )
+                vectorizer_config=self._vectorizer_config(),
+                vector_index_config=self.index_settings.to_config()
             )
             print(f"Collection '{self.collection_name}' created successfully.")
         except Exception as e:
@@ -108,60 +334,649 @@ class WeaviateClient:
             print("Note: Make sure COHERE_API_KEY is configured in your Weaviate instance environment variables.")
             raise
     
-    def insert_products(self, products: List[Dict[str, Any]]):
-        """Insert multiple products into Weaviate using batch operations."""
+    def update_index_settings(self):
+        """Apply the query-time index settings (ef) to an existing collection."""
+        collection = self.client.collections.get(self.collection_name)
+        collection.config.update(vector_index_config=self.index_settings.to_update())
+    
+    def _vectorizer_config(self):
+        """Server-side vectorizer, or none when vectors are computed locally."""
+        if self.embedder is not None:
+            return Configure.Vectorizer.none()
+        return Configure.Vectorizer.text2vec_cohere(
+            model="embed-english-v3.0",
+            truncate="NONE"
+        )
+    
+    def _embed_products(self, products: List[Dict[str, Any]]) -> List[Any]:
+        """Client-side vectors for products, or None for each when Weaviate vectorizes."""
+        if self.embedder is None:
+            return [None] * len(products)
+        return list(self.embedder.embed_products(products))
+    
+    def insert_products(self, products: List[Dict[str, Any]], batch_size: Optional[int] = None):
+        """Insert multiple products into Weaviate using batch operations.
+        
+        Object UUIDs are derived from each product's key (see catalog_sync), so
+        inserting the same product again overwrites it instead of duplicating it.
+        
+        Args:
+            products: Products to insert.
+            batch_size: Use fixed-size batches of this many objects instead of dynamic batching.
+        """
         try:
             collection = self.client.collections.get(self.collection_name)
             
+            if batch_size:
+                batcher = collection.batch.fixed_size(batch_size=batch_size)
+            else:
+                batcher = collection.batch.dynamic()
+            
             # Insert products using batch context manager (v4 API)
-            with collection.batch.dynamic() as batch:
-                for product in products:
-                    batch.add_object(properties=product)
+            with batcher as batch:
+                for start in range(0, len(products), EMBED_BATCH_SIZE):
+                    chunk = products[start:start + EMBED_BATCH_SIZE]
+                    for product, vector in zip(chunk, self._embed_products(chunk)):
+                        batch.add_object(
+                            properties=with_content_hash(product),
+                            uuid=product_uuid(product),
+                            vector=vector
+                        )
             
+            # Cached search results may no longer reflect the collection
+            self.cache.clear()
+            self.suggest_index.add_products(products)
+            INGEST_OBJECTS.labels(result="inserted").inc(len(products))
             print(f"Inserted {len(products)} products successfully.")
         except Exception as e:
+            WEAVIATE_ERRORS.labels(operation="insert").inc()
             print(f"Error inserting products: {e}")
             raise
     
-    def search_products(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
-        """Perform semantic search on products."""
+    def ingest_products(
+        self,
+        products: Iterable[Dict[str, Any]],
+        batch_size: int = 200,
+        concurrent_requests: int = 2,
+        chunk_size: int = 10000,
+        max_retries: int = 3,
+        retry_backoff: float = 1.0,
+        checkpoint: Optional[Checkpoint] = None,
+        progress: bool = True
+    ) -> IngestStats:
+        """Stream products of any size into Weaviate with fixed-size batches.
+        
+        Products are consumed lazily in chunks of chunk_size and written with
+        deterministic UUIDs, so re-running a load is idempotent. After each chunk,
+        objects rejected by Weaviate are retried with exponential backoff, the
+        checkpoint (if any) is advanced past the chunk and throughput is reported.
+        On restart with the same checkpoint, already committed rows are skipped.
+        
+        Args:
+            products: Any iterable of product dicts, e.g. ingest.read_products(path).
+            batch_size: Objects per batch request.
+            concurrent_requests: Batch requests in flight at once.
+            chunk_size: Rows between checkpoints and progress reports.
+            max_retries: Retry rounds for failed objects before giving up on them.
+            retry_backoff: Initial retry delay in seconds, doubled every round.
+            checkpoint: Resume position; updated after every committed chunk.
+            progress: Print objects/sec after every chunk.
+        
+        Returns:
+            IngestStats with counts, throughput and the products that still
+            failed, as given (so they can be written out and re-ingested).
+        """
+        collection = self.client.collections.get(self.collection_name)
+        stats = IngestStats()
+        
+        skip = checkpoint.offset if checkpoint else 0
+        if skip:
+            print(f"Resuming ingestion after {skip} already committed rows.")
+        rows = iter(products)
+        # Skip rows committed by a previous run
+        for _ in islice(rows, skip):
+            pass
+        stats.skipped = skip
+        
         try:
-            collection = self.client.collections.get(self.collection_name)
-            
-            # Perform semantic search using v4 API
+            while True:
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    break
+                chunk_started = time.monotonic()
+                
+                vectors = self._embed_products(chunk)
+                # uuid -> product as read, to report failures in the input format
+                originals = {}
+                with collection.batch.fixed_size(batch_size=batch_size, concurrent_requests=concurrent_requests) as batch:
+                    for product, vector in zip(chunk, vectors):
+                        object_uuid = product_uuid(product)
+                        originals[str(object_uuid)] = product
+                        batch.add_object(
+                            properties=with_content_hash(product),
+                            uuid=object_uuid,
+                            vector=vector
+                        )
+                failed = collection.batch.failed_objects
+                
+                delay = retry_backoff
+                for _ in range(max_retries):
+                    if not failed:
+                        break
+                    time.sleep(delay)
+                    delay *= 2
+                    stats.retried += len(failed)
+                    with collection.batch.fixed_size(batch_size=batch_size, concurrent_requests=concurrent_requests) as batch:
+                        for error in failed:
+                            batch.add_object(
+                                properties=error.object_.properties,
+                                uuid=error.object_.uuid,
+                                vector=error.object_.vector
+                            )
+                    failed = collection.batch.failed_objects
+                
+                chunk_elapsed = time.monotonic() - chunk_started
+                INGEST_BATCH_SECONDS.observe(chunk_elapsed)
+                if chunk_elapsed > 0:
+                    INGEST_RATE.set(len(chunk) / chunk_elapsed)
+                INGEST_OBJECTS.labels(result="inserted").inc(len(chunk) - len(failed))
+                INGEST_OBJECTS.labels(result="failed").inc(len(failed))
+                
+                self.suggest_index.add_products(chunk)
+                stats.processed += len(chunk)
+                stats.inserted += len(chunk) - len(failed)
+                stats.failed.extend(
+                    {"product": originals[str(error.object_.uuid)], "error": error.message}
+                    for error in failed
+                )
+                
+                if checkpoint:
+                    checkpoint.save(skip + stats.processed)
+                if progress:
+                    print(stats.progress_line())
+        finally:
+            # Cached search results may no longer reflect the collection
+            self.cache.clear()
+        
+        print(f"Ingested {stats.inserted} products ({len(stats.failed)} failed) "
+              f"in {stats.elapsed:.1f}s ({stats.rate:.0f} objects/sec).")
+        return stats
+    
+    def sync_products(
+        self,
+        products: Iterable[Dict[str, Any]],
+        batch_size: int = 200,
+        concurrent_requests: int = 2,
+        delete_missing: bool = True,
+        progress: bool = True
+    ) -> SyncStats:
+        """Make the collection match products, writing only what changed.
+        
+        Stored content hashes are read with a cursor scan first. Incoming products
+        whose hash is unchanged are skipped, so they are neither re-sent nor
+        re-vectorized. New and changed products are upserted through
+        ingest_products. With delete_missing, stored objects that are not in
+        products are deleted; this includes duplicates with random UUIDs left
+        by loads that predate deterministic IDs.
+        
+        Args:
+            products: The complete catalog, as any iterable of product dicts.
+            batch_size: Objects per batch request.
+            concurrent_requests: Batch requests in flight at once.
+            delete_missing: Delete stored products absent from the catalog.
+            progress: Print ingestion progress.
+        
+        Returns:
+            SyncStats with created/updated/unchanged/deleted/failed counts.
+        """
+        collection = self.client.collections.get(self.collection_name)
+        stats = SyncStats()
+        
+        # uuid -> content hash of everything currently stored
+        stored: Dict[str, Optional[str]] = {}
+        for obj in collection.iterator(return_properties=[CONTENT_HASH_PROPERTY], cache_size=1000):
+            stored[str(obj.uuid)] = obj.properties.get(CONTENT_HASH_PROPERTY)
+        print(f"Found {len(stored)} stored products.")
+        
+        seen = set()
+        
+        def changed(rows: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+            for product in rows:
+                object_uuid = product_uuid(product)
+                seen.add(object_uuid)
+                previous = stored.get(object_uuid)
+                if previous == content_hash(product):
+                    stats.unchanged += 1
+                    continue
+                if object_uuid in stored:
+                    stats.updated += 1
+                else:
+                    stats.created += 1
+                yield product
+        
+        ingest_stats = self.ingest_products(
+            changed(products),
+            batch_size=batch_size,
+            concurrent_requests=concurrent_requests,
+            progress=progress
+        )
+        stats.failed = len(ingest_stats.failed)
+        
+        if delete_missing:
+            missing = [object_uuid for object_uuid in stored if object_uuid not in seen]
+            for start in range(0, len(missing), SYNC_DELETE_BATCH_SIZE):
+                chunk = missing[start:start + SYNC_DELETE_BATCH_SIZE]
+                collection.data.delete_many(where=Filter.by_id().contains_any(chunk))
+                stats.deleted += len(chunk)
+            if missing:
+                self.cache.clear()
+        
+        print(f"Sync complete: {stats.summary()}.")
+        return stats
+    
+    def search_products(self, query: str, limit: int = 20, offset: int = 0,
+                        filters: Optional[Dict[str, Any]] = None) -> List[Product]:
+        """Perform semantic search on products.
+        
+        Results are served from the query cache when possible; concurrent
+        identical misses share a single Weaviate call.
+        
+        Raises:
+            ValueError: filters has a key not in FILTER_FIELDS.
+        """
+        _check_filters(filters)
+        try:
+            return self.cache.get_or_compute(
+                make_key(query, limit, filters, offset=offset),
+                lambda: self._search_products(query, limit, offset, filters)
+            )
+        except Exception:
+            WEAVIATE_ERRORS.labels(operation="search").inc()
+            logger.exception("Error during search")
+            return []
+    
+    def _search_products(self, query: str, limit: int, offset: int = 0,
+                         filters: Optional[Dict[str, Any]] = None) -> List[Product]:
+        """Run the hybrid query against Weaviate (uncached)."""
+        collection = self.client.collections.get(self.collection_name)
+        
+        # Perform semantic search using v4 API
+        vector = None
+        if self.embedder is not None:
+            with timed("embed"):
+                vector = _query_vector(self.embedder, query)
+        
+        with timed("weaviate"):
             response = collection.query.hybrid(
                 query=query,
+                vector=vector,
                 alpha=1,
+                limit=limit,
+                offset=offset,
+                filters=_build_filters(filters),
                 #certainty=0.5,
-                return_metadata=["distance", "certainty"]
+                return_properties=list(PRODUCT_PROPERTIES),
+                return_metadata=MetadataQuery(score=True)
             )
+        
+        # Convert response objects to compact results
+        with timed("convert"):
+            return [Product.from_object(obj) for obj in response.objects]
+    
+    def get_all_products(self, limit: int = 100, offset: int = 0,
+                         filters: Optional[Dict[str, Any]] = None) -> List[Product]:
+        """Get all products (for testing/display purposes), optionally filtered."""
+        _check_filters(filters)
+        try:
+            collection = self.client.collections.get(self.collection_name)
             
-            # Convert response objects to dictionaries
-            products = []
-            for obj in response.objects:
-                product = obj.properties
-                products.append(product)
+            # Get all products
+            with timed("weaviate"):
+                response = collection.query.fetch_objects(
+                    limit=limit,
+                    offset=offset,
+                    filters=_build_filters(filters),
+                    return_properties=list(PRODUCT_PROPERTIES)
+                )
             
-            return products
-        except Exception as e:
-            print(f"Error during search: {e}")
+            # Convert response objects to compact results
+            with timed("convert"):
+                return [Product.from_object(obj) for obj in response.objects]
+        except Exception:
+            WEAVIATE_ERRORS.labels(operation="fetch").inc()
+            logger.exception("Error fetching products")
             return []
     
-    def get_all_products(self, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get all products (for testing/display purposes)."""
+    def get_facets(self, filters: Optional[Dict[str, Any]] = None, limit: int = 50) -> Dict[str, Any]:
+        """Count products per category and brand with aggregate queries.
+        
+        Counts cover the filtered catalog, not the results of a search query.
+        
+        Args:
+            filters: Restrict the counts to products matching these filters;
+                each facet ignores its own filter (see _facet_queries).
+            limit: Maximum values returned per facet, most frequent first.
+        
+        Returns:
+            {"total": n, "category": [(value, count), ...], "brand": [...]}, or {} on error.
+        
+        Raises:
+            ValueError: filters has a key not in FILTER_FIELDS.
+        """
+        _check_filters(filters)
+        try:
+            return self.cache.get_or_compute(
+                make_facet_key(filters, limit),
+                lambda: self._get_facets(filters, limit)
+            )
+        except Exception:
+            WEAVIATE_ERRORS.labels(operation="aggregate").inc()
+            logger.exception("Error computing facets")
+            return {}
+    
+    def _get_facets(self, filters: Optional[Dict[str, Any]], limit: int) -> Dict[str, Any]:
+        """Run the facet aggregates against Weaviate (uncached)."""
+        collection = self.client.collections.get(self.collection_name)
+        queries = _facet_queries(filters)
+        with timed("facets"):
+            responses = [
+                collection.aggregate.over_all(
+                    filters=_build_filters(query_filters),
+                    total_count=True,
+                    return_metrics=_facet_metrics(fields, limit)
+                )
+                for query_filters, fields in queries
+            ]
+        return _to_facets(responses, queries)
+    
+    def get_products_page(self, limit: int = 20, after: Optional[str] = None) -> Tuple[List[Product], Optional[str]]:
+        """Fetch one page of the catalog using cursor pagination.
+        
+        Args:
+            limit: Page size.
+            after: UUID of the last object of the previous page, or None for the first page.
+        
+        Returns:
+            Tuple of (products, next_cursor). next_cursor is None on the last page.
+        """
+        try:
+            collection = self.client.collections.get(self.collection_name)
+            with timed("weaviate"):
+                response = collection.query.fetch_objects(
+                    limit=limit,
+                    after=after,
+                    return_properties=list(PRODUCT_PROPERTIES)
+                )
+            with timed("convert"):
+                return _to_page(response.objects, limit)
+        except Exception:
+            WEAVIATE_ERRORS.labels(operation="fetch").inc()
+            logger.exception("Error fetching products")
+            return [], None
+    
+    def iter_products(self, batch_size: int = 1000,
+                      return_properties: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        """Stream every product in the collection in constant memory.
+        
+        Uses the collection's cursor iterator, fetching batch_size objects per
+        request, so exports can walk catalogs of any size.
+        
+        Args:
+            batch_size: Objects fetched per request.
+            return_properties: Only fetch these properties (default: all).
+        """
+        collection = self.client.collections.get(self.collection_name)
+        for obj in collection.iterator(return_properties=return_properties, cache_size=batch_size):
+            yield obj.properties
+
+
+class AsyncWeaviateClient:
+    """Non-blocking counterpart of WeaviateClient for use inside the event loop.
+    
+    Built on the v4 async client. Creating an instance does not open a connection;
+    call ``connect()`` (e.g. from the FastAPI lifespan handler) before querying and
+    ``close()`` on shutdown, or use it as an async context manager.
+    """
+    
+    def __init__(self, url: str = None, cache: Optional[QueryCache] = None, client=None,
+                 embedder: Optional[Embedder] = None):
+        """Create the async Weaviate client without connecting.
+        
+        Args:
+            url: Weaviate URL. If not provided, uses WEAVIATE_URL from .env or defaults to http://localhost:8080
+            cache: Search result cache. Defaults to the process-wide shared cache.
+            client: Pre-built v4 client to use instead of connecting to url
+                (e.g. the in-memory fake from fake_weaviate.py).
+            embedder: Local embedder for bring-your-own-vectors mode. Defaults to
+                the one named by EMBEDDER; if none, Weaviate vectorizes with Cohere.
+        """
+        headers = _get_headers()
+        is_local, host, port = _parse_url(url)
+        
+        if client is not None:
+            self.client = client
+        elif is_local:
+            self.client = weaviate.use_async_with_local(headers=headers)
+        else:
+            self.client = weaviate.use_async_with_custom(
+                http_host=host,
+                http_port=port,
+                grpc_port=50051,
+                http_secure=False,
+                grpc_secure=False,
+                headers=headers
+            )
+        
+        self.collection_name = "Product"
+        self.cache = cache if cache is not None else default_query_cache
+        self.embedder = embedder if embedder is not None else embedder_from_env()
+    
+    async def __aenter__(self):
+        """Async context manager entry - open connection."""
+        await self.connect()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit - close connection."""
+        await self.close()
+    
+    async def connect(self):
+        """Open the connection to Weaviate."""
+        if not self.client.is_connected():
+            await self.client.connect()
+    
+    async def close(self):
+        """Close the Weaviate client connection."""
+        if hasattr(self, 'client') and self.client:
+            await self.client.close()
+    
+    async def search_products(self, query: str, limit: int = 20, offset: int = 0,
+                              filters: Optional[Dict[str, Any]] = None) -> List[Product]:
+        """Perform semantic search on products without blocking the event loop.
+        
+        Results are served from the query cache when possible; concurrent
+        identical misses share a single Weaviate call.
+        
+        Raises:
+            ValueError: filters has a key not in FILTER_FIELDS.
+        """
+        _check_filters(filters)
+        try:
+            return await self.cache.aget_or_compute(
+                make_key(query, limit, filters, offset=offset),
+                lambda: self._search_products(query, limit, offset, filters)
+            )
+        except Exception:
+            WEAVIATE_ERRORS.labels(operation="search").inc()
+            logger.exception("Error during search")
+            return []
+    
+    async def _search_products(self, query: str, limit: int, offset: int = 0,
+                               filters: Optional[Dict[str, Any]] = None) -> List[Product]:
+        """Run the hybrid query against Weaviate (uncached)."""
+        collection = self.client.collections.get(self.collection_name)
+        
+        vector = None
+        if self.embedder is not None:
+            with timed("embed"):
+                vector = _query_vector(self.embedder, query)
+        
+        with timed("weaviate"):
+            response = await collection.query.hybrid(
+                query=query,
+                vector=vector,
+                alpha=1,
+                limit=limit,
+                offset=offset,
+                filters=_build_filters(filters),
+                return_properties=list(PRODUCT_PROPERTIES),
+                return_metadata=MetadataQuery(score=True)
+            )
+        
+        # Convert response objects to compact results
+        with timed("convert"):
+            return [Product.from_object(obj) for obj in response.objects]
+    
+    async def search_many(self, queries: List[Dict[str, Any]],
+                          max_concurrency: int = 8,
+                          semaphore: Optional[asyncio.Semaphore] = None) -> List[Union[List[Product], Exception]]:
+        """Run many searches concurrently over the shared connection.
+        
+        Unlike search_products, a failed search is not turned into an empty
+        result: its exception is returned in its slot, so callers can tell a
+        failure from "no match" while the other searches still succeed.
+        
+        Args:
+            queries: One dict per search with "query" and optional "limit",
+                "offset" and "filters" (see search_products).
+            max_concurrency: Maximum searches in flight at once.
+            semaphore: Limit shared with other calls (e.g. all requests of
+                a server); overrides max_concurrency.
+        
+        Returns:
+            Result lists (or the exception of a failed search) in the same
+            order as queries.
+        
+        Raises:
+            ValueError: A query's filters have a key not in FILTER_FIELDS
+                (checked before any search runs).
+        """
+        for spec in queries:
+            _check_filters(spec.get("filters"))
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run(spec: Dict[str, Any]) -> Union[List[Product], Exception]:
+            query = spec["query"]
+            limit = spec.get("limit", 20)
+            offset = spec.get("offset", 0)
+            filters = spec.get("filters")
+            async with semaphore:
+                try:
+                    return await self.cache.aget_or_compute(
+                        make_key(query, limit, filters, offset=offset),
+                        lambda: self._search_products(query, limit, offset, filters)
+                    )
+                except Exception as e:
+                    WEAVIATE_ERRORS.labels(operation="search").inc()
+                    logger.exception("Error during batch search")
+                    return e
+        
+        return await asyncio.gather(*(run(spec) for spec in queries))
+    
+    async def get_all_products(self, limit: int = 100, offset: int = 0,
+                               filters: Optional[Dict[str, Any]] = None) -> List[Product]:
+        """Get all products (for testing/display purposes), optionally filtered."""
+        _check_filters(filters)
         try:
             collection = self.client.collections.get(self.collection_name)
             
-            # Get all products
-            response = collection.query.fetch_objects(limit=limit)
-            
-            # Convert response objects to dictionaries
-            products = []
-            for obj in response.objects:
-                product = obj.properties
-                products.append(product)
+            with timed("weaviate"):
+                response = await collection.query.fetch_objects(
+                    limit=limit,
+                    offset=offset,
+                    filters=_build_filters(filters),
+                    return_properties=list(PRODUCT_PROPERTIES)
+                )
             
-            return products
-        except Exception as e:
-            print(f"Error fetching products: {e}")
+            # Convert response objects to compact results
+            with timed("convert"):
+                return [Product.from_object(obj) for obj in response.objects]
+        except Exception:
+            WEAVIATE_ERRORS.labels(operation="fetch").inc()
+            logger.exception("Error fetching products")
             return []
+    
+    async def get_facets(self, filters: Optional[Dict[str, Any]] = None, limit: int = 50) -> Dict[str, Any]:
+        """Count products per category and brand with aggregate queries.
+        
+        Counts cover the filtered catalog, not the results of a search query.
+        
+        Args:
+            filters: Restrict the counts to products matching these filters;
+                each facet ignores its own filter (see _facet_queries).
+            limit: Maximum values returned per facet, most frequent first.
+        
+        Returns:
+            {"total": n, "category": [(value, count), ...], "brand": [...]}, or {} on error.
+        
+        Raises:
+            ValueError: filters has a key not in FILTER_FIELDS.
+        """
+        _check_filters(filters)
+        try:
+            return await self.cache.aget_or_compute(
+                make_facet_key(filters, limit),
+                lambda: self._get_facets(filters, limit)
+            )
+        except Exception:
+            WEAVIATE_ERRORS.labels(operation="aggregate").inc()
+            logger.exception("Error computing facets")
+            return {}
+    
+    async def _get_facets(self, filters: Optional[Dict[str, Any]], limit: int) -> Dict[str, Any]:
+        """Run the facet aggregates against Weaviate concurrently (uncached)."""
+        collection = self.client.collections.get(self.collection_name)
+        queries = _facet_queries(filters)
+        with timed("facets"):
+            responses = await asyncio.gather(*(
+                collection.aggregate.over_all(
+                    filters=_build_filters(query_filters),
+                    total_count=True,
+                    return_metrics=_facet_metrics(fields, limit)
+                )
+                for query_filters, fields in queries
+            ))
+        return _to_facets(responses, queries)
+    
+    async def get_products_page(self, limit: int = 20, after: Optional[str] = None) -> Tuple[List[Product], Optional[str]]:
+        """Fetch one page of the catalog using cursor pagination.
+        
+        Args:
+            limit: Page size.
+            after: UUID of the last object of the previous page, or None for the first page.
+        
+        Returns:
+            Tuple of (products, next_cursor). next_cursor is None on the last page.
+        """
+        try:
+            collection = self.client.collections.get(self.collection_name)
+            with timed("weaviate"):
+                response = await collection.query.fetch_objects(
+                    limit=limit,
+                    after=after,
+                    return_properties=list(PRODUCT_PROPERTIES)
+                )
+            with timed("convert"):
+                return _to_page(response.objects, limit)
+        except Exception:
+            WEAVIATE_ERRORS.labels(operation="fetch").inc()
+            logger.exception("Error fetching products")
+            return [], None
+    
+    async def iter_products(self, batch_size: int = 1000,
+                            return_properties: Optional[List[str]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Stream every product (or only return_properties of each) in constant memory."""
+        collection = self.client.collections.get(self.collection_name)
+        async for obj in collection.iterator(return_properties=return_properties, cache_size=batch_size):
+            yield obj.properties